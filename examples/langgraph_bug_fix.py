@@ -34,8 +34,8 @@ async def main():
     
     # Load configuration
     try:
-        config = load_config()
-        workspace = config.workspace
+        config = load_config().to_dict()
+        workspace = config["workspace"]
     except Exception as e:
         logger.warning(f"Could not load config: {e}, using defaults")
         workspace = "."
@@ -48,7 +48,7 @@ async def main():
     print("Initializing LangGraph Orchestrator...")
     orchestrator = LangGraphOrchestrator(
         workspace=workspace,
-        config=config.__dict__ if hasattr(config, '__dict__') else config,
+        config=config,
         enable_chat_display=True
     )
     print("✓ Orchestrator initialized")
@@ -156,6 +156,10 @@ async def main():
         print()
         print("Error executing bug fix workflow:", str(e))
         logger.error(f"Bug fix workflow failed: {e}", exc_info=True)
+    
+    finally:
+        # Release the checkpoint database connection
+        await orchestrator.close()
 
 
 if __name__ == "__main__":
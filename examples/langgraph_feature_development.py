@@ -35,8 +35,8 @@ async def main():
     
     # Load configuration
     try:
-        config = load_config()
-        workspace = config.workspace
+        config = load_config().to_dict()
+        workspace = config["workspace"]
     except Exception as e:
         logger.warning(f"Could not load config: {e}, using defaults")
         workspace = "."
@@ -49,7 +49,7 @@ async def main():
     print("Initializing LangGraph Orchestrator...")
     orchestrator = LangGraphOrchestrator(
         workspace=workspace,
-        config=config.__dict__ if hasattr(config, '__dict__') else config,
+        config=config,
         enable_chat_display=True
     )
     print("✓ Orchestrator initialized with state persistence enabled")
@@ -193,6 +193,10 @@ async def main():
         print(f"Error: {e}")
         print()
         logger.error(f"Workflow execution failed: {e}", exc_info=True)
+    
+    finally:
+        # Release the checkpoint database connection
+        await orchestrator.close()
 
 
 if __name__ == "__main__":
@@ -39,8 +39,8 @@ async def main():
     
     # Load configuration
     try:
-        config = load_config()
-        workspace = config.workspace
+        config = load_config().to_dict()
+        workspace = config["workspace"]
     except Exception as e:
         logger.warning(f"Could not load config: {e}, using defaults")
         workspace = "."
@@ -52,56 +52,57 @@ async def main():
     # Create orchestrator
     orchestrator = LangGraphOrchestrator(
         workspace=workspace,
-        config=config.__dict__ if hasattr(config, '__dict__') else config,
+        config=config,
         enable_chat_display=True
     )
     
-    # Check for existing checkpoints
-    checkpoint_db = Path(workspace) / "checkpoints.db"
+    try:
+        # Check for existing checkpoints
+        checkpoint_db = Path(workspace) / "checkpoints.db"
     
-    if checkpoint_db.exists():
-        print(f"✓ Found checkpoint database: {checkpoint_db}")
-        print()
-        print("Options:")
-        print("  1. Resume an existing workflow")
-        print("  2. Start a new workflow")
-        print()
+        if checkpoint_db.exists():
+            print(f"✓ Found checkpoint database: {checkpoint_db}")
+            print()
+            print("Options:")
+            print("  1. Resume an existing workflow")
+            print("  2. Start a new workflow")
+            print()
         
-        choice = input("Enter choice (1 or 2): ").strip()
+            choice = input("Enter choice (1 or 2): ").strip()
         
-        if choice == "1":
-            thread_id = input("Enter workflow ID (thread_id) to resume: ").strip()
+            if choice == "1":
+                thread_id = input("Enter workflow ID (thread_id) to resume: ").strip()
             
-            if thread_id:
-                print(f"\nResuming workflow: {thread_id}")
-                print("Note: The workflow will continue from its last checkpoint.")
-                print()
+                if thread_id:
+                    print(f"\nResuming workflow: {thread_id}")
+                    print("Note: The workflow will continue from its last checkpoint.")
+                    print()
                 
-                # Resume workflow
-                try:
-                    final_state = await orchestrator.execute_feature_development(
-                        requirement="Resuming from checkpoint...",
-                        thread_id=thread_id
-                    )
+                    # Resume workflow
+                    try:
+                        final_state = await orchestrator.execute_feature_development(
+                            requirement="Resuming from checkpoint...",
+                            thread_id=thread_id
+                        )
                     
-                    print("\n✓ Workflow resumed and completed!")
-                    actual_state = list(final_state.values())[0] if final_state else {}
-                    print(f"Status: {actual_state.get('status', 'N/A')}")
-                    print(f"Completed Steps: {actual_state.get('completed_steps', [])}")
+                        print("\n✓ Workflow resumed and completed!")
+                        actual_state = list(final_state.values())[0] if final_state else {}
+                        print(f"Status: {actual_state.get('status', 'N/A')}")
+                        print(f"Completed Steps: {actual_state.get('completed_steps', [])}")
                     
-                except Exception as e:
-                    print(f"\n✗ Error resuming workflow: {e}")
-                    logger.error(f"Resume failed: {e}", exc_info=True)
+                    except Exception as e:
+                        print(f"\n✗ Error resuming workflow: {e}")
+                        logger.error(f"Resume failed: {e}", exc_info=True)
                 
-                return
-    else:
-        print("No checkpoint database found. Starting new workflow...")
-        print()
+                    return
+        else:
+            print("No checkpoint database found. Starting new workflow...")
+            print()
     
-    # Start new workflow with known thread_id for easy resumption
-    thread_id = "demo_workflow_001"
+        # Start new workflow with known thread_id for easy resumption
+        thread_id = "demo_workflow_001"
     
-    requirement = """
+        requirement = """
     Create a simple blog API with:
     - Post creation and retrieval
     - Comment system
@@ -109,37 +110,37 @@ async def main():
     - Tag support
     """
     
-    print(f"Starting new workflow with thread_id: {thread_id}")
-    print("You can interrupt this with Ctrl+C and resume later using:")
-    print(f"  thread_id='{thread_id}'")
-    print()
-    print("Requirement:")
-    print("-" * 70)
-    print(requirement.strip())
-    print("-" * 70)
-    print()
+        print(f"Starting new workflow with thread_id: {thread_id}")
+        print("You can interrupt this with Ctrl+C and resume later using:")
+        print(f"  thread_id='{thread_id}'")
+        print()
+        print("Requirement:")
+        print("-" * 70)
+        print(requirement.strip())
+        print("-" * 70)
+        print()
     
-    try:
-        final_state = await orchestrator.execute_feature_development(
-            requirement=requirement,
-            thread_id=thread_id
-        )
+        try:
+            final_state = await orchestrator.execute_feature_development(
+                requirement=requirement,
+                thread_id=thread_id
+            )
         
-        print("\n✓ Workflow completed!")
-        actual_state = list(final_state.values())[0] if final_state else {}
-        print(f"Status: {actual_state.get('status', 'N/A')}")
+            print("\n✓ Workflow completed!")
+            actual_state = list(final_state.values())[0] if final_state else {}
+            print(f"Status: {actual_state.get('status', 'N/A')}")
         
-    except KeyboardInterrupt:
-        print("\n\n" + "=" * 70)
-        print("Workflow Interrupted!")
-        print("=" * 70)
-        print()
-        print("The workflow state has been saved to checkpoint database.")
-        print("To resume, run this script again and select option 1.")
-        print(f"Use thread_id: {thread_id}")
-        print()
-        print("Or use the Python API:")
-        print(f"""
+        except KeyboardInterrupt:
+            print("\n\n" + "=" * 70)
+            print("Workflow Interrupted!")
+            print("=" * 70)
+            print()
+            print("The workflow state has been saved to checkpoint database.")
+            print("To resume, run this script again and select option 1.")
+            print(f"Use thread_id: {thread_id}")
+            print()
+            print("Or use the Python API:")
+            print(f"""
 from src.orchestrator.langgraph_orchestrator import LangGraphOrchestrator
 
 orchestrator = LangGraphOrchestrator(workspace=".", enable_chat_display=True)
@@ -148,11 +149,15 @@ final_state = await orchestrator.execute_feature_development(
     thread_id="{thread_id}"
 )
         """)
-        print()
+            print()
     
-    except Exception as e:
-        print(f"\n✗ Error: {e}")
-        logger.error(f"Workflow failed: {e}", exc_info=True)
+        except Exception as e:
+            print(f"\n✗ Error: {e}")
+            logger.error(f"Workflow failed: {e}", exc_info=True)
+    
+    finally:
+        # Release the checkpoint database connection
+        await orchestrator.close()
 
 
 if __name__ == "__main__":
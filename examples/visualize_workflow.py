@@ -35,8 +35,8 @@ async def visualize_feature_development():
     
     # Load configuration
     try:
-        config = load_config()
-        workspace = config.workspace
+        config = load_config().to_dict()
+        workspace = config["workspace"]
     except Exception as e:
         logger.warning(f"Could not load config: {e}, using defaults")
         workspace = "."
@@ -49,12 +49,16 @@ async def visualize_feature_development():
     print("Building workflow graph...")
     orchestrator = LangGraphOrchestrator(
         workspace=workspace,
-        config=config.__dict__ if hasattr(config, '__dict__') else config,
+        config=config,
         enable_chat_display=True
     )
     
-    # Build the graph
-    app = await orchestrator.build_feature_development_graph()
+    # Build the graph; only its structure is needed, so release the
+    # checkpoint database connection straight away
+    try:
+        app = await orchestrator.build_feature_development_graph()
+    finally:
+        await orchestrator.close()
     
     print("✓ Graph built successfully")
     print()
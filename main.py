@@ -4,9 +4,15 @@ import sys
 from pathlib import Path
 from typing import Optional
 
-from src.config import load_config
+from src.config import load_config_async
 from src.orchestrator import LangGraphOrchestrator
 
+# uvloop is optional; it gives a faster event loop where it is installed
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 
 def setup_logging(log_level: str, log_file: Optional[str] = None):
     log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
@@ -26,7 +32,12 @@ def setup_logging(log_level: str, log_file: Optional[str] = None):
 
 
 async def main():
-    config = load_config()
+    # Start new tasks eagerly so short coroutines finish without a loop
+    # round-trip (eager_task_factory is available on Python 3.12+)
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+    
+    config = await load_config_async()
     
     setup_logging(config.log_level, config.log_file)
     logger = logging.getLogger(__name__)
@@ -105,7 +116,7 @@ async def main():
         print("="*80)
         
         # Extract the actual state from the event dict
-        actual_state = list(final_state.values())[0] if final_state else {}
+        actual_state = next(iter(final_state.values()), {}) if final_state else {}
         
         print(f"\nWorkflow ID: {actual_state.get('workflow_id', 'N/A')}")
         print(f"Status: {actual_state.get('status', 'N/A')}")
@@ -129,6 +140,8 @@ async def main():
         logger.error(f"Error executing workflow: {e}", exc_info=True)
         print(f"\n✗ Error: {e}")
         return 1
+    finally:
+        await orchestrator.close()
     
     print("\n" + "="*80 + "\n")
     logger.info("System shutdown complete")
@@ -137,7 +150,9 @@ async def main():
 
 if __name__ == "__main__":
     try:
-        exit_code = asyncio.run(main())
+        loop_factory = uvloop.new_event_loop if uvloop is not None else None
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            exit_code = runner.run(main())
         sys.exit(exit_code or 0)
     except KeyboardInterrupt:
         print("\n\nInterrupted by user")
@@ -1,10 +1,12 @@
 import asyncio
+import hashlib
 import subprocess
 import json
 from abc import ABC, abstractmethod
 from enum import Enum
 from typing import Dict, List, Optional, Any, Callable, AsyncIterator
 from dataclasses import dataclass, field
+from collections import OrderedDict
 from datetime import datetime
 import logging
 import os
@@ -14,6 +16,10 @@ from ..utils.llm_client_pool import get_llm_client
 
 logger = logging.getLogger(__name__)
 
+# Successful LLM responses keyed by a fingerprint of the request, shared by
+# all agents in the process (LRU order; only used when LLM_RESPONSE_CACHE_SIZE > 0)
+_llm_response_cache: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+
 
 class AgentRole(Enum):
     BUSINESS_ANALYST = "business_analyst"
@@ -31,7 +37,7 @@ class AgentStatus(Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     task_id: str
     description: str
@@ -44,7 +50,7 @@ class Task:
     error: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentMessage:
     from_agent: str
     to_agent: Optional[str]
@@ -80,6 +86,7 @@ class BaseAgent(ABC):
         self.max_retries = int(os.getenv('LLM_MAX_RETRIES', '3'))
         self.retry_initial_delay = float(os.getenv('LLM_RETRY_INITIAL_DELAY', '1.0'))
         self.retry_max_delay = float(os.getenv('LLM_RETRY_MAX_DELAY', '60.0'))
+        self.response_cache_size = int(os.getenv('LLM_RESPONSE_CACHE_SIZE', '0'))
         
     @abstractmethod
     async def process_task(self, task: Task) -> Dict[str, Any]:
@@ -154,9 +161,33 @@ class BaseAgent(ABC):
             
             logger.info(f"[{self.agent_id}] Using local llama-server at {api_base}")
             
+            # Identical prompts to the same model with the same sampling
+            # settings can reuse an earlier response
+            cache_key = None
+            if self.response_cache_size > 0:
+                cache_key = hashlib.sha256(json.dumps([
+                    api_base,
+                    os.getenv('OPENAI_API_MODEL', 'devstral'),
+                    os.getenv('OPENAI_TEMPERATURE', '0.7'),
+                    os.getenv('OPENAI_MAX_TOKENS', '2048'),
+                    system_prompt,
+                    full_prompt,
+                ]).encode('utf-8')).hexdigest()
+                cached = _llm_response_cache.get(cache_key)
+                if cached is not None:
+                    _llm_response_cache.move_to_end(cache_key)
+                    logger.info(f"[{self.agent_id}] Reusing cached LLM response")
+                    # Streaming consumers still expect to see the output
+                    if stream_callback and cached.get("stdout"):
+                        try:
+                            stream_callback(cached["stdout"])
+                        except Exception as e:
+                            logger.warning(f"[{self.agent_id}] Stream callback error: {e}")
+                    return dict(cached)
+            
             # Wrap with retry logic and circuit breaker
             try:
-                return await retry_with_exponential_backoff(
+                result = await retry_with_exponential_backoff(
                     self.circuit_breaker.call(self._call_local_llama_server),
                     system_prompt,
                     full_prompt,
@@ -177,6 +208,13 @@ class BaseAgent(ABC):
                     "error": f"LLM service is temporarily unavailable (circuit breaker open). Please try again later."
                 }
             
+            if cache_key is not None and result.get("success"):
+                _llm_response_cache[cache_key] = dict(result)
+                while len(_llm_response_cache) > self.response_cache_size:
+                    _llm_response_cache.popitem(last=False)
+            
+            return result
+            
         except asyncio.TimeoutError:
             logger.error(f"[{self.agent_id}] Task timed out after {timeout} seconds")
             return {
@@ -393,7 +431,8 @@ class BaseAgent(ABC):
         return task
     
     async def send_message(self, message: AgentMessage):
-        await self.message_queue.put(message)
+        # The queue is unbounded, so put_nowait never blocks and skips put()'s await
+        self.message_queue.put_nowait(message)
     
     async def receive_message(self) -> AgentMessage:
         return await self.message_queue.get()
@@ -1,3 +1,3 @@
-from .settings import Settings, load_config
+from .settings import Settings, load_config, load_config_async
 
-__all__ = ['Settings', 'load_config']
+__all__ = ['Settings', 'load_config', 'load_config_async']
@@ -1,21 +1,46 @@
+import asyncio
+import copy
+import operator
 import os
-import yaml
-import json
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple, Callable
 from pathlib import Path
-from dataclasses import dataclass, field
-from dotenv import load_dotenv
+from dataclasses import dataclass, field, fields
 import logging
 
 logger = logging.getLogger(__name__)
 
+_VALID_LOG_LEVELS = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
+
+# Single-field validation rules: (field name, predicate, error message template)
+_FIELD_VALIDATORS: Tuple[Tuple[str, Callable[[Any], bool], str], ...] = (
+    ("log_level", lambda v: v.upper() in _VALID_LOG_LEVELS,
+     f"log_level must be one of {_VALID_LOG_LEVELS}, got '{{value}}'"),
+    ("llm_timeout", lambda v: v > 0, "llm_timeout must be positive, got {value}"),
+    ("task_timeout", lambda v: v > 0, "task_timeout must be positive, got {value}"),
+    ("llm_max_retries", lambda v: v >= 0, "llm_max_retries cannot be negative, got {value}"),
+    ("llm_retry_initial_delay", lambda v: v > 0, "llm_retry_initial_delay must be positive, got {value}"),
+    ("llm_circuit_breaker_threshold", lambda v: v > 0, "llm_circuit_breaker_threshold must be positive, got {value}"),
+    ("llm_circuit_breaker_timeout", lambda v: v > 0, "llm_circuit_breaker_timeout must be positive, got {value}"),
+    ("max_concurrent_agents", lambda v: v > 0, "max_concurrent_agents must be positive, got {value}"),
+    ("task_retry_attempts", lambda v: v >= 0, "task_retry_attempts cannot be negative, got {value}"),
+    ("output_directory", bool, "output_directory cannot be empty"),
+)
+
+# Loaded settings keyed by absolute config path; each entry carries the
+# (mtime_ns, size, workspace override) stamp it was built from so that an
+# edited file or a changed WORKSPACE env var invalidates it.
+_config_cache: Dict[str, Tuple[Tuple[int, int, Optional[str]], 'Settings']] = {}
+
+# Whether .env has already been loaded into os.environ
+_dotenv_loaded = False
+
 
 class ConfigValidationError(Exception):
     """Raised when configuration validation fails"""
     pass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Settings:
     workspace: str
     log_level: str = "INFO"
@@ -55,61 +80,27 @@ class Settings:
         Raises:
             ConfigValidationError: If validation fails
         """
-        errors: List[str] = []
+        errors: List[str] = [
+            message.format(value=getattr(self, name))
+            for name, is_valid, message in _FIELD_VALIDATORS
+            if not is_valid(getattr(self, name))
+        ]
         
-        # Validate workspace
+        # Cross-field and filesystem checks
         if not self.workspace:
-            errors.append("workspace cannot be empty")
+            errors.insert(0, "workspace cannot be empty")
         elif not Path(self.workspace).exists():
             logger.warning(f"Workspace directory does not exist: {self.workspace}")
         
-        # Validate log level
-        valid_log_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-        if self.log_level.upper() not in valid_log_levels:
-            errors.append(f"log_level must be one of {valid_log_levels}, got '{self.log_level}'")
-        
-        # Validate timeouts
-        if self.llm_timeout <= 0:
-            errors.append(f"llm_timeout must be positive, got {self.llm_timeout}")
-        
-        if self.task_timeout <= 0:
-            errors.append(f"task_timeout must be positive, got {self.task_timeout}")
-        
-        # Validate retry configuration
-        if self.llm_max_retries < 0:
-            errors.append(f"llm_max_retries cannot be negative, got {self.llm_max_retries}")
-        
-        if self.llm_max_retries > 10:
-            logger.warning(f"llm_max_retries is very high ({self.llm_max_retries}), consider reducing")
-        
-        if self.llm_retry_initial_delay <= 0:
-            errors.append(f"llm_retry_initial_delay must be positive, got {self.llm_retry_initial_delay}")
-        
         if self.llm_retry_max_delay <= self.llm_retry_initial_delay:
             errors.append(f"llm_retry_max_delay ({self.llm_retry_max_delay}) must be greater than llm_retry_initial_delay ({self.llm_retry_initial_delay})")
         
-        # Validate circuit breaker configuration
-        if self.llm_circuit_breaker_threshold <= 0:
-            errors.append(f"llm_circuit_breaker_threshold must be positive, got {self.llm_circuit_breaker_threshold}")
-        
-        if self.llm_circuit_breaker_timeout <= 0:
-            errors.append(f"llm_circuit_breaker_timeout must be positive, got {self.llm_circuit_breaker_timeout}")
-        
-        # Validate concurrent agents
-        if self.max_concurrent_agents <= 0:
-            errors.append(f"max_concurrent_agents must be positive, got {self.max_concurrent_agents}")
+        if self.llm_max_retries > 10:
+            logger.warning(f"llm_max_retries is very high ({self.llm_max_retries}), consider reducing")
         
         if self.max_concurrent_agents > 20:
             logger.warning(f"max_concurrent_agents is very high ({self.max_concurrent_agents}), this may cause resource issues")
         
-        # Validate task retry attempts
-        if self.task_retry_attempts < 0:
-            errors.append(f"task_retry_attempts cannot be negative, got {self.task_retry_attempts}")
-        
-        # Validate output directory
-        if not self.output_directory:
-            errors.append("output_directory cannot be empty")
-        
         # Raise all errors at once
         if errors:
             raise ConfigValidationError(
@@ -118,67 +109,117 @@ class Settings:
     
     @classmethod
     def from_dict(cls, config: Dict[str, Any]) -> 'Settings':
-        return cls(
-            workspace=config.get('workspace', config.get('cursor_workspace', os.getcwd())),
-            log_level=config.get('log_level', 'INFO'),
-            log_file=config.get('log_file'),
-            agents=config.get('agents', {}),
-            llm_timeout=config.get('llm_timeout', config.get('cursor_timeout', 300)),
-            llm_max_retries=config.get('llm_max_retries', 3),
-            llm_retry_initial_delay=config.get('llm_retry_initial_delay', 1.0),
-            llm_retry_max_delay=config.get('llm_retry_max_delay', 60.0),
-            llm_circuit_breaker_threshold=config.get('llm_circuit_breaker_threshold', 5),
-            llm_circuit_breaker_timeout=config.get('llm_circuit_breaker_timeout', 60.0),
-            llm_stream_responses=config.get('llm_stream_responses', True),
-            max_concurrent_agents=config.get('max_concurrent_agents', 5),
-            task_retry_attempts=config.get('task_retry_attempts', 3),
-            task_timeout=config.get('task_timeout', 600),
-            enable_message_bus=config.get('enable_message_bus', True),
-            enable_task_persistence=config.get('enable_task_persistence', False),
-            enable_structured_logging=config.get('enable_structured_logging', True),
-            enable_metrics=config.get('enable_metrics', True),
-            output_directory=config.get('output_directory', './output')
-        )
+        values = dict(config)
+        # Legacy cursor_* keys
+        values.setdefault('workspace', config.get('cursor_workspace', os.getcwd()))
+        if 'llm_timeout' not in values and 'cursor_timeout' in config:
+            values['llm_timeout'] = config['cursor_timeout']
+        
+        return cls(**{f.name: values[f.name] for f in fields(cls) if f.name in values})
     
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            'workspace': self.workspace,
-            'log_level': self.log_level,
-            'log_file': self.log_file,
-            'agents': self.agents,
-            'llm_timeout': self.llm_timeout,
-            'llm_max_retries': self.llm_max_retries,
-            'llm_retry_initial_delay': self.llm_retry_initial_delay,
-            'llm_retry_max_delay': self.llm_retry_max_delay,
-            'llm_circuit_breaker_threshold': self.llm_circuit_breaker_threshold,
-            'llm_circuit_breaker_timeout': self.llm_circuit_breaker_timeout,
-            'llm_stream_responses': self.llm_stream_responses,
-            'max_concurrent_agents': self.max_concurrent_agents,
-            'task_retry_attempts': self.task_retry_attempts,
-            'task_timeout': self.task_timeout,
-            'enable_message_bus': self.enable_message_bus,
-            'enable_task_persistence': self.enable_task_persistence,
-            'enable_structured_logging': self.enable_structured_logging,
-            'enable_metrics': self.enable_metrics,
-            'output_directory': self.output_directory
-        }
-
-
-def load_config(config_path: Optional[str] = None) -> Settings:
-    # Load .env file to make environment variables available
-    load_dotenv()
+        values = dict(zip(_SETTINGS_FIELD_NAMES, _get_settings_fields(self)))
+        # Nested agent configs are copied so callers cannot mutate shared settings
+        values['agents'] = copy.deepcopy(self.agents)
+        return values
+
+
+_SETTINGS_FIELD_NAMES = tuple(f.name for f in fields(Settings))
+_get_settings_fields = operator.attrgetter(*_SETTINGS_FIELD_NAMES)
+
+
+def _yaml_load(stream: Any) -> Any:
+    import yaml
+    # Prefer the libyaml-backed loader when PyYAML was built with it
+    try:
+        from yaml import CSafeLoader as Loader
+    except ImportError:
+        from yaml import SafeLoader as Loader
+    return yaml.load(stream, Loader=Loader)
+
+
+def _yaml_dump(data: Any, stream: Any) -> None:
+    import yaml
+    try:
+        from yaml import CSafeDumper as Dumper
+    except ImportError:
+        from yaml import SafeDumper as Dumper
+    yaml.dump(data, stream, Dumper=Dumper, default_flow_style=False)
+
+
+def load_config(config_path: Optional[str] = None, force_reload: bool = False) -> Settings:
+    """
+    Load settings from a YAML/JSON config file.
+    
+    Args:
+        config_path: Config file path (defaults to $AGENT_CONFIG_PATH or config.yaml)
+        force_reload: Re-read .env and the config file even if they were loaded before
+    
+    Returns:
+        Settings instance, shared between calls while the file is unchanged
+    """
+    global _dotenv_loaded
+    
+    # Load .env file once to make environment variables available; a forced
+    # reload lets edited .env values replace the ones loaded before
+    if force_reload or not _dotenv_loaded:
+        from dotenv import load_dotenv
+        load_dotenv(override=force_reload)
+        _dotenv_loaded = True
     
     if config_path is None:
         config_path = os.getenv('AGENT_CONFIG_PATH', 'config.yaml')
     
     config_file = Path(config_path)
     
-    if not config_file.exists():
+    try:
+        stat = config_file.stat()
+    except FileNotFoundError:
         return Settings(workspace=os.getcwd())
     
+    # Also check environment variable for workspace
+    env_workspace = os.getenv('WORKSPACE') or os.getenv('CURSOR_WORKSPACE')
+    if env_workspace:
+        workspace_path = Path(env_workspace)
+        if not workspace_path.is_absolute():
+            workspace_path = Path.cwd() / workspace_path
+        env_workspace = str(workspace_path.resolve())
+    
+    # Reuse the previously built Settings while the file is unchanged
+    cache_path = str(config_file.resolve())
+    stamp = (stat.st_mtime_ns, stat.st_size, env_workspace)
+    cached = _config_cache.get(cache_path)
+    if cached is not None and cached[0] == stamp and not force_reload:
+        return cached[1]
+    
+    config_data = _parse_config_file(config_file)
+    if env_workspace:
+        config_data['workspace'] = env_workspace
+    
+    settings = Settings.from_dict(config_data)
+    _config_cache[cache_path] = (stamp, settings)
+    return settings
+
+
+async def load_config_async(config_path: Optional[str] = None, force_reload: bool = False) -> Settings:
+    """
+    Async variant of load_config for use inside a running event loop.
+    
+    The file reads and parsing run in a worker thread so they do not block
+    the loop; arguments and caching behave exactly like load_config.
+    """
+    return await asyncio.to_thread(load_config, config_path, force_reload)
+
+
+def _parse_config_file(config_file: Path) -> Dict[str, Any]:
+    import json
+    
     with open(config_file, 'r') as f:
         if config_file.suffix in ['.yaml', '.yml']:
-            config_data = yaml.safe_load(f)
+            if os.getenv('AGENT_CONFIG_CACHE') == '1':
+                config_data = _load_yaml_with_json_cache(config_file, f.read())
+            else:
+                config_data = _yaml_load(f)
         elif config_file.suffix == '.json':
             config_data = json.load(f)
         else:
@@ -196,23 +237,53 @@ def load_config(config_path: Optional[str] = None) -> Settings:
         if 'cursor_workspace' in config_data:
             del config_data['cursor_workspace']
     
-    # Also check environment variable for workspace
-    env_workspace = os.getenv('WORKSPACE') or os.getenv('CURSOR_WORKSPACE')
-    if env_workspace:
-        workspace_path = Path(env_workspace)
-        if not workspace_path.is_absolute():
-            workspace_path = Path.cwd() / workspace_path
-        config_data['workspace'] = str(workspace_path.resolve())
+    return config_data
+
+
+def _load_yaml_with_json_cache(config_file: Path, raw: str) -> Dict[str, Any]:
+    """
+    Parse YAML through a JSON side-cache stored next to the config file.
+    
+    The cache (``<config>.cache.json``) holds the parsed YAML together with a
+    digest of the raw text; it is only trusted when it is at least as new as
+    the YAML file and the digest matches, otherwise the YAML is re-parsed and
+    the cache rewritten.
+    """
+    import hashlib
+    import json
+    
+    cache_file = config_file.with_name(config_file.name + '.cache.json')
+    digest = hashlib.blake2b(raw.encode('utf-8'), digest_size=16).hexdigest()
+    
+    try:
+        if cache_file.stat().st_mtime_ns >= config_file.stat().st_mtime_ns:
+            with open(cache_file, 'r') as f:
+                cached = json.load(f)
+            if cached.get('digest') == digest:
+                return cached['config']
+    except (OSError, ValueError, KeyError, AttributeError):
+        pass
     
-    return Settings.from_dict(config_data)
+    config_data = _yaml_load(raw)
+    
+    try:
+        payload = json.dumps({'digest': digest, 'config': config_data}, separators=(',', ':'))
+        with open(cache_file, 'w') as f:
+            f.write(payload)
+    except (OSError, TypeError, ValueError) as e:
+        logger.debug(f"Could not write config cache {cache_file}: {e}")
+    
+    return config_data
 
 
 def save_config(settings: Settings, config_path: str = 'config.yaml') -> None:
+    import json
+    
     config_file = Path(config_path)
     
     with open(config_file, 'w') as f:
         if config_file.suffix in ['.yaml', '.yml']:
-            yaml.dump(settings.to_dict(), f, default_flow_style=False)
+            _yaml_dump(settings.to_dict(), f)
         elif config_file.suffix == '.json':
             json.dump(settings.to_dict(), f, indent=2)
         else:
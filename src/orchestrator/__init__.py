@@ -1,7 +1,27 @@
-from .langgraph_orchestrator import LangGraphOrchestrator
-from .task_manager import TaskManager
+import importlib
 
 __all__ = [
     'LangGraphOrchestrator',
     'TaskManager',
 ]
+
+# Submodule providing each public name; imported on first attribute access
+# so that e.g. TaskManager users do not pay for importing LangGraph.
+_LAZY_IMPORTS = {
+    'LangGraphOrchestrator': '.langgraph_orchestrator',
+    'TaskManager': '.task_manager',
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
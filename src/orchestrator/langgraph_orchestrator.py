@@ -7,8 +7,12 @@ conditional routing, and workflow visualization.
 """
 
 import asyncio
+import functools
 import logging
-from typing import Dict, List, Optional, Any, Literal
+import os
+import time
+import uuid
+from typing import Dict, List, Optional, Any, Literal, Tuple, Callable, get_type_hints
 from datetime import datetime
 from pathlib import Path
 import json
@@ -32,6 +36,12 @@ except ImportError:
         logger = logging.getLogger(__name__)
         logger.info("Using MemorySaver for checkpointing (in-memory, not persistent)")
 
+# orjson is optional; it serializes workflow results much faster than json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from ..agents import (
     BaseAgent,
     AgentRole,
@@ -56,6 +66,147 @@ from ..utils.chat_display import AgentChatDisplay, ProgressTracker
 
 logger = logging.getLogger(__name__)
 
+# Applied to the SQLite checkpoint connection when it is opened. WAL lets
+# readers run alongside checkpoint writes and, with synchronous=NORMAL, avoids
+# an fsync per commit; busy_timeout waits out brief lock contention. The
+# larger page cache (64 MiB, negative = KiB) and in-memory temp tables keep
+# checkpoint lookups for long-running threads off the disk.
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+)
+
+# Steps run in parallel after implementation; errors in them are critical
+_PARALLEL_STEPS = frozenset({"qa_testing", "infrastructure"})
+
+# Bug-fix workflow steps, in order:
+# (step / node name, agent role, task description, state input key, state output key)
+_BUG_FIX_STEPS = (
+    ("bug_analysis", "qa_engineer", "Analyze and reproduce the bug", "bug_description", "bug_analysis"),
+    ("bug_fix", "developer", "Fix the bug", "bug_analysis", "bug_fix"),
+    ("regression_testing", "qa_engineer", "Run regression tests", "bug_fix", "regression_tests"),
+    ("release_notes", "technical_writer", "Update release notes", "bug_fix", "release_notes"),
+)
+
+# State keys read by qa_engineer_node and devops_engineer_node
+_PARALLEL_BRANCH_KEYS = ("workflow_id", "requirement", "workflow_type", "implementation")
+
+# (role key, agent_id, agent class) for every agent the orchestrator runs
+_AGENT_SPECS = (
+    ("business_analyst", "ba_001", BusinessAnalystAgent),
+    ("developer", "dev_001", DeveloperAgent),
+    ("qa_engineer", "qa_001", QAEngineerAgent),
+    ("devops_engineer", "devops_001", DevOpsEngineerAgent),
+    ("technical_writer", "writer_001", TechnicalWriterAgent),
+)
+
+
+def _state_reducers(state_cls: type) -> Dict[str, Callable[[Any, Any], Any]]:
+    """Map each Annotated key of a state schema to its reducer"""
+    return {
+        name: hint.__metadata__[0]
+        for name, hint in get_type_hints(state_cls, include_extras=True).items()
+        if hasattr(hint, "__metadata__")
+    }
+
+
+# Reducers declared on each state schema, used to fold streamed node updates
+# into the full state without asking the checkpointer
+_STATE_REDUCERS = {
+    state_cls: _state_reducers(state_cls)
+    for state_cls in (MultiAgentState, BugFixState, InfrastructureState, AnalysisState)
+}
+
+
+def _merge_event(
+    state: Dict[str, Any],
+    event: Dict[str, Any],
+    reducers: Dict[str, Callable[[Any, Any], Any]]
+) -> None:
+    """Apply the node updates of one astream() event to state in place"""
+    for update in event.values():
+        for key, value in (update or {}).items():
+            reducer = reducers.get(key)
+            if reducer is not None and key in state:
+                state[key] = reducer(state[key], value)
+            else:
+                state[key] = value
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize values json/orjson cannot encode natively"""
+    # Match orjson's native datetime output on the stdlib json fallback
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    return str(obj)
+
+
+def _agent_node(step: str, agent_role: str, parallel: bool = False, status: str = "failed"):
+    """Record any exception raised by an agent node as a failure of its step"""
+    def decorator(node):
+        @functools.wraps(node)
+        async def wrapper(self, state):
+            try:
+                return await node(self, state)
+            except Exception as e:
+                logger.error(f"Error in {node.__name__}: {e}", exc_info=True)
+                return self._step_failure(step, agent_role, str(e), parallel=parallel, status=status)
+        return wrapper
+    return decorator
+
+
+def _no_op(*args, **kwargs):
+    return None
+
+
+class _NullChatDisplay:
+    """
+    Stand-in for AgentChatDisplay when the chat display is disabled.
+    
+    Every display method is a no-op, so nodes can call the display
+    unconditionally; it is falsy so `if self.chat_display:` still works.
+    """
+    
+    def __bool__(self) -> bool:
+        return False
+    
+    def __getattr__(self, name: str):
+        return _no_op
+
+
+class _ProgressBatcher:
+    """Coalesce per-event progress logs into one line per batch or interval"""
+    
+    def __init__(self, workflow_id: str, max_items: int = 50, max_interval: float = 0.5):
+        self.workflow_id = workflow_id
+        self.max_items = max_items
+        self.max_interval = max_interval
+        self.pending = 0
+        self.last_node: Optional[str] = None
+        self.last_flush = time.monotonic()
+    
+    def add(self, event: Dict[str, Any]):
+        """Record a streamed graph event, flushing when the batch is due"""
+        self.pending += len(event)
+        for node_name in event:
+            self.last_node = node_name
+        if (self.pending >= self.max_items
+                or time.monotonic() - self.last_flush >= self.max_interval):
+            self.flush()
+    
+    def flush(self):
+        """Log a summary of the events seen since the previous flush"""
+        if self.pending:
+            logger.info(
+                "[%s] Progress: %d events, last_node=%s",
+                self.workflow_id, self.pending, self.last_node
+            )
+            self.pending = 0
+        self.last_flush = time.monotonic()
+
 
 class LangGraphOrchestrator:
     """
@@ -80,610 +231,455 @@ class LangGraphOrchestrator:
         self.workspace = workspace
         self.config = config or {}
         self.checkpoint_db = checkpoint_db or str(Path(workspace) / "checkpoints.db")
+        
+        # Workflow results and chat logs go here; created once up front
+        self.output_dir = Path(workspace) / "output"
+        self.output_dir.mkdir(parents=True, exist_ok=True)
         self.agents: Dict[str, BaseAgent] = {}
         self._initialize_agents()
         
-        # Compiled graphs cache
+        # Caps agent tasks (LLM calls) in flight across all running workflows.
+        # A plain config dict skips Settings.validate(), so check it here: 0
+        # would block every agent node forever
+        max_concurrent_agents = int(self.config.get("max_concurrent_agents", 5))
+        if max_concurrent_agents < 1:
+            raise ValueError(
+                f"max_concurrent_agents must be at least 1, got {max_concurrent_agents}"
+            )
+        self._agent_semaphore = asyncio.Semaphore(max_concurrent_agents)
+        
+        # Compiled graphs cache, keyed by workflow type
         self._compiled_graphs: Dict[str, Any] = {}
+        self._graph_lock = asyncio.Lock()
+        
+        # Checkpointer shared by all graphs; opened on first build, see close()
+        self._checkpointer: Optional[Any] = None
+        self._checkpointer_cm: Optional[Any] = None
         
         # Interactive chat display
         self.enable_chat_display = enable_chat_display
-        self.chat_display = AgentChatDisplay() if enable_chat_display else None
+        self.chat_display = AgentChatDisplay() if enable_chat_display else _NullChatDisplay()
         self.progress_tracker: Optional[ProgressTracker] = None
     
     def _initialize_agents(self):
         """Initialize all agent instances"""
         agent_configs = self.config.get("agents", {})
         
-        # Business Analyst
-        ba_config = agent_configs.get("business_analyst", {}).copy()
-        self.agents["business_analyst"] = BusinessAnalystAgent(
-            agent_id="ba_001",
-            workspace=self.workspace,
-            config=ba_config
-        )
+        for role, agent_id, agent_class in _AGENT_SPECS:
+            self.agents[role] = agent_class(
+                agent_id=agent_id,
+                workspace=self.workspace,
+                config=agent_configs.get(role)
+            )
         
-        # Developer
-        dev_config = agent_configs.get("developer", {}).copy()
-        self.agents["developer"] = DeveloperAgent(
-            agent_id="dev_001",
-            workspace=self.workspace,
-            config=dev_config
-        )
+        logger.info("Initialized %d agents for LangGraph orchestration", len(self.agents))
+    
+    def get_agent_by_role(self, role: AgentRole) -> Optional[BaseAgent]:
+        """Return the agent for a role (agents are keyed by role value)"""
+        return self.agents.get(role.value)
+    
+    # ==================== Agent Node Functions ====================
+    
+    async def _run_agent_task(self, agent: BaseAgent, task: Task) -> Task:
+        """Run an agent task, waiting for a slot under max_concurrent_agents"""
+        async with self._agent_semaphore:
+            return await agent.run_task(task)
+    
+    def _step_failure(
+        self,
+        step: str,
+        agent_role: str,
+        error: str,
+        parallel: bool = False,
+        status: str = "failed"
+    ) -> Dict[str, Any]:
+        """Build the state update for an agent node whose step failed"""
+        self.chat_display.agent_error(agent_role, error)
         
-        # QA Engineer
-        qa_config = agent_configs.get("qa_engineer", {}).copy()
-        self.agents["qa_engineer"] = QAEngineerAgent(
-            agent_id="qa_001",
-            workspace=self.workspace,
-            config=qa_config
+        timestamp = datetime.now().isoformat()
+        update = {
+            "errors": [{
+                "step": step,
+                "error": error,
+                "timestamp": timestamp
+            }],
+            "completed_steps": [step],
+        }
+        # Parallel branches run in the same step, so they must not both
+        # write the single-value current_step/status keys
+        if not parallel:
+            update["current_step"] = step
+            update["status"] = status
+            if status == "completed":
+                update["completed_at"] = timestamp
+        return update
+    
+    @_agent_node("business_analyst", "business_analyst")
+    async def business_analyst_node(self, state: MultiAgentState) -> Dict[str, Any]:
+        """Business Analyst Agent Node"""
+        logger.info("[%s] Executing Business Analyst node", state["workflow_id"])
+        
+        self.chat_display.agent_message(
+            "business_analyst",
+            f"Starting requirements analysis...\n\nRequirement: {state['requirement'][:150]}...",
+            message_type="start"
         )
         
-        # DevOps Engineer
-        devops_config = agent_configs.get("devops_engineer", {}).copy()
-        self.agents["devops_engineer"] = DevOpsEngineerAgent(
-            agent_id="devops_001",
-            workspace=self.workspace,
-            config=devops_config
+        agent = self.agents["business_analyst"]
+        
+        self.chat_display.agent_action(
+            "business_analyst",
+            "is analyzing requirements and creating user stories",
+            "Identifying stakeholders, use cases, and acceptance criteria"
         )
         
-        # Technical Writer
-        writer_config = agent_configs.get("technical_writer", {}).copy()
-        self.agents["technical_writer"] = TechnicalWriterAgent(
-            agent_id="writer_001",
-            workspace=self.workspace,
-            config=writer_config
+        task = Task(
+            task_id=f"ba_{time.time()}",
+            description="Analyze requirements and create user stories",
+            context={
+                "requirement": state["requirement"],
+                "workflow_type": state["workflow_type"],
+                "task_type": "requirements_analysis",
+            }
         )
         
-        logger.info(f"Initialized {len(self.agents)} agents for LangGraph orchestration")
-    
-    # ==================== Agent Node Functions ====================
-    
-    async def business_analyst_node(self, state: MultiAgentState) -> Dict[str, Any]:
-        """Business Analyst Agent Node"""
-        logger.info(f"[{state['workflow_id']}] Executing Business Analyst node")
+        completed_task = await self._run_agent_task(agent, task)
         
-        if self.chat_display:
-            self.chat_display.agent_message(
-                "business_analyst",
-                f"Starting requirements analysis...\n\nRequirement: {state['requirement'][:150]}...",
-                message_type="start"
-            )
+        if completed_task.error:
+            return self._step_failure("business_analyst", "business_analyst", completed_task.error)
         
-        try:
-            agent = self.agents["business_analyst"]
-            
-            if self.chat_display:
-                self.chat_display.agent_action(
-                    "business_analyst",
-                    "is analyzing requirements and creating user stories",
-                    "Identifying stakeholders, use cases, and acceptance criteria"
-                )
-            
-            task = Task(
-                task_id=f"ba_{datetime.now().timestamp()}",
-                description="Analyze requirements and create user stories",
-                context={
-                    "requirement": state["requirement"],
-                    "workflow_type": state["workflow_type"],
-                    "task_type": "requirements_analysis",
-                }
-            )
-            
-            completed_task = await agent.run_task(task)
-            
-            if completed_task.error:
-                if self.chat_display:
-                    self.chat_display.agent_error("business_analyst", completed_task.error)
-                
-                return {
-                    "errors": [{
-                        "step": "business_analyst",
-                        "error": completed_task.error,
-                        "timestamp": datetime.now().isoformat()
-                    }],
-                    "current_step": "business_analyst",
-                    "completed_steps": ["business_analyst"],
-                    "status": "failed"
-                }
-            
-            files_created = completed_task.result.get("files_created", []) if completed_task.result else []
-            
-            if self.chat_display:
-                summary = completed_task.result.get("summary", "Requirements analysis completed") if completed_task.result else "Requirements analysis completed"
-                self.chat_display.agent_completed(
-                    "business_analyst",
-                    summary,
-                    files_created
-                )
-            
-            return {
-                "business_analysis": [completed_task.result] if completed_task.result else [],
-                "files_created": files_created,
-                "current_step": "business_analyst",
-                "completed_steps": ["business_analyst"],
-            }
-            
-        except Exception as e:
-            logger.error(f"Error in business_analyst_node: {e}", exc_info=True)
-            
-            if self.chat_display:
-                self.chat_display.agent_error("business_analyst", str(e))
-            
-            return {
-                "errors": [{
-                    "step": "business_analyst",
-                    "error": str(e),
-                    "timestamp": datetime.now().isoformat()
-                }],
-                "current_step": "business_analyst",
-                "completed_steps": ["business_analyst"],
-                "status": "failed"
-            }
+        result = completed_task.result or {}
+        files_created = result.get("files_created", [])
+        
+        summary = result.get("summary", "Requirements analysis completed")
+        self.chat_display.agent_completed(
+            "business_analyst",
+            summary,
+            files_created
+        )
+        
+        return {
+            "business_analysis": result,
+            "files_created": files_created,
+            "current_step": "business_analyst",
+            "completed_steps": ["business_analyst"],
+        }
     
+    @_agent_node("architecture_design", "developer")
     async def developer_design_node(self, state: MultiAgentState) -> Dict[str, Any]:
         """Developer Agent - Architecture Design Node"""
-        logger.info(f"[{state['workflow_id']}] Executing Developer Design node")
+        logger.info("[%s] Executing Developer Design node", state["workflow_id"])
         
-        if self.chat_display:
-            self.chat_display.inter_agent_communication(
-                "business_analyst",
-                "developer",
-                "Handoff: Requirements and user stories are ready for architecture design",
-                communication_type="handoff"
-            )
+        self.chat_display.inter_agent_communication(
+            "business_analyst",
+            "developer",
+            "Handoff: Requirements and user stories are ready for architecture design",
+            communication_type="handoff"
+        )
             
-            self.chat_display.agent_message(
-                "developer",
-                "Reviewing requirements and designing system architecture...\nPlanning components, services, and data models.",
-                message_type="thinking"
-            )
+        self.chat_display.agent_message(
+            "developer",
+            "Reviewing requirements and designing system architecture...\nPlanning components, services, and data models.",
+            message_type="thinking"
+        )
         
-        try:
-            agent = self.agents["developer"]
-            
-            # Get business analysis from previous step
-            business_analysis = state.get("business_analysis", [])
-            
-            if self.chat_display:
-                self.chat_display.agent_action(
-                    "developer",
-                    "is designing system architecture",
-                    "Creating architecture diagrams, API specifications, and data models"
-                )
-            
-            task = Task(
-                task_id=f"dev_design_{datetime.now().timestamp()}",
-                description="Design system architecture based on requirements",
-                context={
-                    "requirement": state["requirement"],
-                    "workflow_type": state["workflow_type"],
-                    "task_type": "architecture_design",
-                    "business_analysis": business_analysis[-1] if business_analysis else {},
-                }
-            )
-            
-            completed_task = await agent.run_task(task)
-            
-            if completed_task.error:
-                if self.chat_display:
-                    self.chat_display.agent_error("developer", completed_task.error)
-                
-                return {
-                    "errors": [{
-                        "step": "architecture_design",
-                        "error": completed_task.error,
-                        "timestamp": datetime.now().isoformat()
-                    }],
-                    "current_step": "architecture_design",
-                    "completed_steps": ["architecture_design"],
-                    "status": "failed"
-                }
-            
-            files_created = completed_task.result.get("files_created", []) if completed_task.result else []
-            
-            if self.chat_display:
-                summary = completed_task.result.get("summary", "Architecture design completed") if completed_task.result else "Architecture design completed"
-                self.chat_display.agent_completed(
-                    "developer",
-                    summary,
-                    files_created
-                )
-            
-            return {
-                "architecture": [completed_task.result] if completed_task.result else [],
-                "files_created": files_created,
-                "current_step": "architecture_design",
-                "completed_steps": ["architecture_design"],
-            }
-            
-        except Exception as e:
-            logger.error(f"Error in developer_design_node: {e}", exc_info=True)
-            
-            if self.chat_display:
-                self.chat_display.agent_error("developer", str(e))
-            
-            return {
-                "errors": [{
-                    "step": "architecture_design",
-                    "error": str(e),
-                    "timestamp": datetime.now().isoformat()
-                }],
-                "current_step": "architecture_design",
-                "completed_steps": ["architecture_design"],
-                "status": "failed"
+        agent = self.agents["developer"]
+        
+        # Get business analysis from previous step
+        business_analysis = state.get("business_analysis") or {}
+        
+        self.chat_display.agent_action(
+            "developer",
+            "is designing system architecture",
+            "Creating architecture diagrams, API specifications, and data models"
+        )
+        
+        task = Task(
+            task_id=f"dev_design_{time.time()}",
+            description="Design system architecture based on requirements",
+            context={
+                "requirement": state["requirement"],
+                "workflow_type": state["workflow_type"],
+                "task_type": "architecture_design",
+                "business_analysis": business_analysis,
             }
+        )
+        
+        completed_task = await self._run_agent_task(agent, task)
+        
+        if completed_task.error:
+            return self._step_failure("architecture_design", "developer", completed_task.error)
+        
+        result = completed_task.result or {}
+        files_created = result.get("files_created", [])
+        
+        summary = result.get("summary", "Architecture design completed")
+        self.chat_display.agent_completed(
+            "developer",
+            summary,
+            files_created
+        )
+        
+        return {
+            "architecture": result,
+            "files_created": files_created,
+            "current_step": "architecture_design",
+            "completed_steps": ["architecture_design"],
+        }
     
+    @_agent_node("implementation", "developer")
     async def developer_implementation_node(self, state: MultiAgentState) -> Dict[str, Any]:
         """Developer Agent - Implementation Node"""
-        logger.info(f"[{state['workflow_id']}] Executing Developer Implementation node")
+        logger.info("[%s] Executing Developer Implementation node", state["workflow_id"])
         
-        if self.chat_display:
-            self.chat_display.agent_message(
-                "developer",
-                "Starting implementation based on architecture design...\nWriting code, creating modules, and setting up project structure.",
-                message_type="working"
-            )
+        self.chat_display.agent_message(
+            "developer",
+            "Starting implementation based on architecture design...\nWriting code, creating modules, and setting up project structure.",
+            message_type="working"
+        )
         
-        try:
-            agent = self.agents["developer"]
-            
-            architecture = state.get("architecture", [])
-            
-            if self.chat_display:
-                self.chat_display.agent_action(
-                    "developer",
-                    "is implementing the feature",
-                    "Writing source code, configuration files, and setting up dependencies"
-                )
-            
-            task = Task(
-                task_id=f"dev_impl_{datetime.now().timestamp()}",
-                description="Implement the feature based on architecture design",
-                context={
-                    "requirement": state["requirement"],
-                    "workflow_type": state["workflow_type"],
-                    "task_type": "implementation",
-                    "architecture": architecture[-1] if architecture else {},
-                }
-            )
-            
-            completed_task = await agent.run_task(task)
-            
-            if completed_task.error:
-                if self.chat_display:
-                    self.chat_display.agent_error("developer", completed_task.error)
-                
-                return {
-                    "errors": [{
-                        "step": "implementation",
-                        "error": completed_task.error,
-                        "timestamp": datetime.now().isoformat()
-                    }],
-                    "current_step": "implementation",
-                    "completed_steps": ["implementation"],
-                    "status": "failed"
-                }
-            
-            files_created = completed_task.result.get("files_created", []) if completed_task.result else []
-            
-            if self.chat_display:
-                summary = completed_task.result.get("summary", "Implementation completed successfully") if completed_task.result else "Implementation completed successfully"
-                self.chat_display.agent_completed(
-                    "developer",
-                    summary,
-                    files_created
-                )
-                
-                # Notify about parallel execution starting
-                self.chat_display.parallel_execution_start(["qa_engineer", "devops_engineer"])
-            
-            return {
-                "implementation": [completed_task.result] if completed_task.result else [],
-                "files_created": files_created,
-                "current_step": "implementation",
-                "completed_steps": ["implementation"],
+        agent = self.agents["developer"]
+        
+        architecture = state.get("architecture") or {}
+        
+        self.chat_display.agent_action(
+            "developer",
+            "is implementing the feature",
+            "Writing source code, configuration files, and setting up dependencies"
+        )
+        
+        task = Task(
+            task_id=f"dev_impl_{time.time()}",
+            description="Implement the feature based on architecture design",
+            context={
+                "requirement": state["requirement"],
+                "workflow_type": state["workflow_type"],
+                "task_type": "implementation",
+                "architecture": architecture,
             }
+        )
+        
+        completed_task = await self._run_agent_task(agent, task)
+        
+        if completed_task.error:
+            return self._step_failure("implementation", "developer", completed_task.error)
+        
+        result = completed_task.result or {}
+        files_created = result.get("files_created", [])
+        
+        summary = result.get("summary", "Implementation completed successfully")
+        self.chat_display.agent_completed(
+            "developer",
+            summary,
+            files_created
+        )
             
-        except Exception as e:
-            logger.error(f"Error in developer_implementation_node: {e}", exc_info=True)
-            
-            if self.chat_display:
-                self.chat_display.agent_error("developer", str(e))
-            
-            return {
-                "errors": [{
-                    "step": "implementation",
-                    "error": str(e),
-                    "timestamp": datetime.now().isoformat()
-                }],
-                "current_step": "implementation",
-                "completed_steps": ["implementation"],
-                "status": "failed"
-            }
+        # Notify about parallel execution starting
+        self.chat_display.parallel_execution_start(["qa_engineer", "devops_engineer"])
+        
+        return {
+            "implementation": result,
+            "files_created": files_created,
+            "current_step": "implementation",
+            "completed_steps": ["implementation"],
+        }
     
+    @_agent_node("qa_testing", "qa_engineer", parallel=True)
     async def qa_engineer_node(self, state: MultiAgentState) -> Dict[str, Any]:
         """QA Engineer Agent Node"""
-        logger.info(f"[{state['workflow_id']}] Executing QA Engineer node")
+        logger.info("[%s] Executing QA Engineer node", state["workflow_id"])
         
-        if self.chat_display:
-            self.chat_display.inter_agent_communication(
-                "developer",
-                "qa_engineer",
-                "Handoff: Implementation ready for testing and quality assurance",
-                communication_type="handoff"
-            )
+        self.chat_display.inter_agent_communication(
+            "developer",
+            "qa_engineer",
+            "Handoff: Implementation ready for testing and quality assurance",
+            communication_type="handoff"
+        )
             
-            self.chat_display.agent_message(
-                "qa_engineer",
-                "Reviewing implementation and creating test suite...\nPlanning unit tests, integration tests, and end-to-end tests.",
-                message_type="thinking"
-            )
+        self.chat_display.agent_message(
+            "qa_engineer",
+            "Reviewing implementation and creating test suite...\nPlanning unit tests, integration tests, and end-to-end tests.",
+            message_type="thinking"
+        )
         
-        try:
-            agent = self.agents["qa_engineer"]
-            
-            implementation = state.get("implementation", [])
-            
-            if self.chat_display:
-                self.chat_display.agent_action(
-                    "qa_engineer",
-                    "is creating comprehensive test suite",
-                    "Writing test cases, test fixtures, and test automation scripts"
-                )
-            
-            task = Task(
-                task_id=f"qa_{datetime.now().timestamp()}",
-                description="Create comprehensive test suite",
-                context={
-                    "requirement": state["requirement"],
-                    "workflow_type": state["workflow_type"],
-                    "task_type": "testing",
-                    "implementation": implementation[-1] if implementation else {},
-                }
-            )
-            
-            completed_task = await agent.run_task(task)
-            
-            if completed_task.error:
-                if self.chat_display:
-                    self.chat_display.agent_error("qa_engineer", completed_task.error)
-                
-                return {
-                    "errors": [{
-                        "step": "qa_testing",
-                        "error": completed_task.error,
-                        "timestamp": datetime.now().isoformat()
-                    }],
-                    "completed_steps": ["qa_testing"],
-                }
-            
-            files_created = completed_task.result.get("files_created", []) if completed_task.result else []
-            
-            if self.chat_display:
-                summary = completed_task.result.get("summary", "Test suite created successfully") if completed_task.result else "Test suite created successfully"
-                self.chat_display.agent_completed(
-                    "qa_engineer",
-                    summary,
-                    files_created
-                )
-            
-            return {
-                "tests": [completed_task.result] if completed_task.result else [],
-                "files_created": files_created,
-                "completed_steps": ["qa_testing"],
-            }
-            
-        except Exception as e:
-            logger.error(f"Error in qa_engineer_node: {e}", exc_info=True)
-            
-            if self.chat_display:
-                self.chat_display.agent_error("qa_engineer", str(e))
-            
-            return {
-                "errors": [{
-                    "step": "qa_testing",
-                    "error": str(e),
-                    "timestamp": datetime.now().isoformat()
-                }],
-                "completed_steps": ["qa_testing"],
+        agent = self.agents["qa_engineer"]
+        
+        implementation = state.get("implementation") or {}
+        
+        self.chat_display.agent_action(
+            "qa_engineer",
+            "is creating comprehensive test suite",
+            "Writing test cases, test fixtures, and test automation scripts"
+        )
+        
+        task = Task(
+            task_id=f"qa_{time.time()}",
+            description="Create comprehensive test suite",
+            context={
+                "requirement": state["requirement"],
+                "workflow_type": state["workflow_type"],
+                "task_type": "testing",
+                "implementation": implementation,
             }
+        )
+        
+        completed_task = await self._run_agent_task(agent, task)
+        
+        if completed_task.error:
+            return self._step_failure("qa_testing", "qa_engineer", completed_task.error, parallel=True)
+        
+        result = completed_task.result or {}
+        files_created = result.get("files_created", [])
+        
+        summary = result.get("summary", "Test suite created successfully")
+        self.chat_display.agent_completed(
+            "qa_engineer",
+            summary,
+            files_created
+        )
+        
+        return {
+            "tests": result,
+            "files_created": files_created,
+            "completed_steps": ["qa_testing"],
+        }
     
+    @_agent_node("infrastructure", "devops_engineer", parallel=True)
     async def devops_engineer_node(self, state: MultiAgentState) -> Dict[str, Any]:
         """DevOps Engineer Agent Node"""
-        logger.info(f"[{state['workflow_id']}] Executing DevOps Engineer node")
+        logger.info("[%s] Executing DevOps Engineer node", state["workflow_id"])
         
-        if self.chat_display:
-            self.chat_display.inter_agent_communication(
-                "developer",
-                "devops_engineer",
-                "Handoff: Implementation ready for infrastructure setup and deployment",
-                communication_type="handoff"
-            )
+        self.chat_display.inter_agent_communication(
+            "developer",
+            "devops_engineer",
+            "Handoff: Implementation ready for infrastructure setup and deployment",
+            communication_type="handoff"
+        )
             
-            self.chat_display.agent_message(
-                "devops_engineer",
-                "Setting up deployment infrastructure...\nConfiguring CI/CD pipelines, containers, and cloud resources.",
-                message_type="thinking"
-            )
+        self.chat_display.agent_message(
+            "devops_engineer",
+            "Setting up deployment infrastructure...\nConfiguring CI/CD pipelines, containers, and cloud resources.",
+            message_type="thinking"
+        )
         
-        try:
-            agent = self.agents["devops_engineer"]
-            
-            implementation = state.get("implementation", [])
-            
-            if self.chat_display:
-                self.chat_display.agent_action(
-                    "devops_engineer",
-                    "is setting up deployment infrastructure",
-                    "Creating Docker containers, Kubernetes configs, and CI/CD pipelines"
-                )
-            
-            task = Task(
-                task_id=f"devops_{datetime.now().timestamp()}",
-                description="Set up deployment infrastructure",
-                context={
-                    "requirement": state["requirement"],
-                    "workflow_type": state["workflow_type"],
-                    "task_type": "deployment",
-                    "implementation": implementation[-1] if implementation else {},
-                }
-            )
-            
-            completed_task = await agent.run_task(task)
-            
-            if completed_task.error:
-                if self.chat_display:
-                    self.chat_display.agent_error("devops_engineer", completed_task.error)
-                
-                return {
-                    "errors": [{
-                        "step": "infrastructure",
-                        "error": completed_task.error,
-                        "timestamp": datetime.now().isoformat()
-                    }],
-                    "completed_steps": ["infrastructure"],
-                }
-            
-            files_created = completed_task.result.get("files_created", []) if completed_task.result else []
-            
-            if self.chat_display:
-                summary = completed_task.result.get("summary", "Infrastructure setup completed") if completed_task.result else "Infrastructure setup completed"
-                self.chat_display.agent_completed(
-                    "devops_engineer",
-                    summary,
-                    files_created
-                )
-            
-            return {
-                "infrastructure": [completed_task.result] if completed_task.result else [],
-                "files_created": files_created,
-                "completed_steps": ["infrastructure"],
-            }
-            
-        except Exception as e:
-            logger.error(f"Error in devops_engineer_node: {e}", exc_info=True)
-            
-            if self.chat_display:
-                self.chat_display.agent_error("devops_engineer", str(e))
-            
-            return {
-                "errors": [{
-                    "step": "infrastructure",
-                    "error": str(e),
-                    "timestamp": datetime.now().isoformat()
-                }],
-                "completed_steps": ["infrastructure"],
+        agent = self.agents["devops_engineer"]
+        
+        implementation = state.get("implementation") or {}
+        
+        self.chat_display.agent_action(
+            "devops_engineer",
+            "is setting up deployment infrastructure",
+            "Creating Docker containers, Kubernetes configs, and CI/CD pipelines"
+        )
+        
+        task = Task(
+            task_id=f"devops_{time.time()}",
+            description="Set up deployment infrastructure",
+            context={
+                "requirement": state["requirement"],
+                "workflow_type": state["workflow_type"],
+                "task_type": "deployment",
+                "implementation": implementation,
             }
+        )
+        
+        completed_task = await self._run_agent_task(agent, task)
+        
+        if completed_task.error:
+            return self._step_failure("infrastructure", "devops_engineer", completed_task.error, parallel=True)
+        
+        result = completed_task.result or {}
+        files_created = result.get("files_created", [])
+        
+        summary = result.get("summary", "Infrastructure setup completed")
+        self.chat_display.agent_completed(
+            "devops_engineer",
+            summary,
+            files_created
+        )
+        
+        return {
+            "infrastructure": result,
+            "files_created": files_created,
+            "completed_steps": ["infrastructure"],
+        }
     
+    @_agent_node("documentation", "technical_writer", status="completed")
     async def technical_writer_node(self, state: MultiAgentState) -> Dict[str, Any]:
         """Technical Writer Agent Node"""
-        logger.info(f"[{state['workflow_id']}] Executing Technical Writer node")
+        logger.info("[%s] Executing Technical Writer node", state["workflow_id"])
         
-        if self.chat_display:
-            self.chat_display.system_message(
-                "QA and DevOps completed in parallel. Moving to documentation...",
-                "info"
-            )
+        self.chat_display.system_message(
+            "QA and DevOps completed in parallel. Moving to documentation...",
+            "info"
+        )
             
-            self.chat_display.inter_agent_communication(
-                "system",
-                "technical_writer",
-                "Handoff: All development, testing, and infrastructure work completed. Ready for documentation.",
-                communication_type="handoff"
-            )
+        self.chat_display.inter_agent_communication(
+            "system",
+            "technical_writer",
+            "Handoff: All development, testing, and infrastructure work completed. Ready for documentation.",
+            communication_type="handoff"
+        )
             
-            self.chat_display.agent_message(
-                "technical_writer",
-                "Creating comprehensive documentation...\nWriting API docs, user guides, and deployment instructions.",
-                message_type="thinking"
-            )
+        self.chat_display.agent_message(
+            "technical_writer",
+            "Creating comprehensive documentation...\nWriting API docs, user guides, and deployment instructions.",
+            message_type="thinking"
+        )
         
-        try:
-            agent = self.agents["technical_writer"]
-            
-            implementation = state.get("implementation", [])
-            tests = state.get("tests", [])
-            infrastructure = state.get("infrastructure", [])
-            
-            if self.chat_display:
-                self.chat_display.agent_action(
-                    "technical_writer",
-                    "is creating comprehensive documentation",
-                    "Writing README, API documentation, and user guides"
-                )
-            
-            task = Task(
-                task_id=f"writer_{datetime.now().timestamp()}",
-                description="Create comprehensive documentation",
-                context={
-                    "requirement": state["requirement"],
-                    "workflow_type": state["workflow_type"],
-                    "task_type": "documentation",
-                    "implementation": implementation[-1] if implementation else {},
-                    "tests": tests[-1] if tests else {},
-                    "infrastructure": infrastructure[-1] if infrastructure else {},
-                }
-            )
-            
-            completed_task = await agent.run_task(task)
-            
-            if completed_task.error:
-                if self.chat_display:
-                    self.chat_display.agent_error("technical_writer", completed_task.error)
-                
-                return {
-                    "errors": [{
-                        "step": "documentation",
-                        "error": completed_task.error,
-                        "timestamp": datetime.now().isoformat()
-                    }],
-                    "current_step": "documentation",
-                    "completed_steps": ["documentation"],
-                    "status": "completed"
-                }
-            
-            files_created = completed_task.result.get("files_created", []) if completed_task.result else []
-            
-            if self.chat_display:
-                summary = completed_task.result.get("summary", "Documentation completed successfully") if completed_task.result else "Documentation completed successfully"
-                self.chat_display.agent_completed(
-                    "technical_writer",
-                    summary,
-                    files_created
-                )
-                
-                self.chat_display.system_message(
-                    "✨ Workflow completed successfully! All agents have finished their tasks.",
-                    "completed"
-                )
-            
-            return {
-                "documentation": [completed_task.result] if completed_task.result else [],
-                "files_created": files_created,
-                "current_step": "documentation",
-                "completed_steps": ["documentation"],
-                "status": "completed",
-                "completed_at": datetime.now().isoformat()
+        agent = self.agents["technical_writer"]
+        
+        implementation = state.get("implementation") or {}
+        tests = state.get("tests") or {}
+        infrastructure = state.get("infrastructure") or {}
+        
+        self.chat_display.agent_action(
+            "technical_writer",
+            "is creating comprehensive documentation",
+            "Writing README, API documentation, and user guides"
+        )
+        
+        task = Task(
+            task_id=f"writer_{time.time()}",
+            description="Create comprehensive documentation",
+            context={
+                "requirement": state["requirement"],
+                "workflow_type": state["workflow_type"],
+                "task_type": "documentation",
+                "implementation": implementation,
+                "tests": tests,
+                "infrastructure": infrastructure,
             }
+        )
+        
+        completed_task = await self._run_agent_task(agent, task)
+        
+        if completed_task.error:
+            return self._step_failure("documentation", "technical_writer", completed_task.error, status="completed")
+        
+        result = completed_task.result or {}
+        files_created = result.get("files_created", [])
+        
+        summary = result.get("summary", "Documentation completed successfully")
+        self.chat_display.agent_completed(
+            "technical_writer",
+            summary,
+            files_created
+        )
             
-        except Exception as e:
-            logger.error(f"Error in technical_writer_node: {e}", exc_info=True)
-            
-            if self.chat_display:
-                self.chat_display.agent_error("technical_writer", str(e))
-            
-            return {
-                "errors": [{
-                    "step": "documentation",
-                    "error": str(e),
-                    "timestamp": datetime.now().isoformat()
-                }],
-                "current_step": "documentation",
-                "completed_steps": ["documentation"],
-                "status": "completed",
-                "completed_at": datetime.now().isoformat()
-            }
+        self.chat_display.system_message(
+            "✨ Workflow completed successfully! All agents have finished their tasks.",
+            "completed"
+        )
+        
+        return {
+            "documentation": result,
+            "files_created": files_created,
+            "current_step": "documentation",
+            "completed_steps": ["documentation"],
+            "status": "completed",
+            "completed_at": datetime.now().isoformat()
+        }
     
     # ==================== Conditional Routing ====================
     
@@ -698,25 +694,23 @@ class LangGraphOrchestrator:
         errors = state.get("errors", [])
         
         # Check if implementation step had errors
-        impl_errors = [e for e in errors if e.get("step") == "implementation"]
-        
-        if impl_errors:
-            logger.warning(f"Implementation failed, stopping workflow")
+        if any(e.get("step") == "implementation" for e in errors):
+            logger.warning("Implementation failed, stopping workflow")
             return END
         
         # Check implementation status
-        implementation = state.get("implementation", [])
-        if implementation:
-            impl_status = implementation[-1].get("status")
-            if impl_status == "failed":
-                logger.warning(f"Implementation marked as failed")
-                return END
-        
-        logger.info(f"Implementation successful, proceeding with parallel QA/DevOps")
-        # Return Send objects for parallel execution
+        implementation = state.get("implementation") or {}
+        if implementation.get("status") == "failed":
+            logger.warning("Implementation marked as failed")
+            return END
+        
+        logger.info("Implementation successful, proceeding with parallel QA/DevOps")
+        # Send only what the branch nodes read; Send payloads are checkpointed,
+        # so passing the whole state would store every earlier result again
+        branch_input = {key: state[key] for key in _PARALLEL_BRANCH_KEYS if key in state}
         return [
-            Send("qa_testing", state),
-            Send("infrastructure", state)
+            Send("qa_testing", branch_input),
+            Send("infrastructure", branch_input)
         ]
     
     def route_after_parallel(
@@ -734,21 +728,44 @@ class LangGraphOrchestrator:
         has_devops = "infrastructure" in completed_steps
         
         if not (has_qa and has_devops):
-            logger.warning(f"Not all parallel tasks completed")
+            logger.warning("Not all parallel tasks completed")
             return "failed"
         
         # Check for critical errors
-        critical_errors = [e for e in errors if e.get("step") in ["qa_testing", "infrastructure"]]
-        
-        if critical_errors:
-            logger.warning(f"Critical errors in parallel execution")
+        if any(e.get("step") in _PARALLEL_STEPS for e in errors):
+            logger.warning("Critical errors in parallel execution")
             return "failed"
         
-        logger.info(f"Parallel execution successful, proceeding to documentation")
+        logger.info("Parallel execution successful, proceeding to documentation")
         return "documentation"
     
     # ==================== Workflow Graph Builders ====================
     
+    async def _get_checkpointer(self) -> Any:
+        """Return the shared checkpointer, opening it on first use"""
+        if self._checkpointer is None:
+            if AsyncSqliteSaver is None:
+                self._checkpointer = MemorySaver()
+                logger.info("Using MemorySaver for checkpointing (in-memory, not persisted across restarts)")
+            else:
+                # Keep the connection open for the orchestrator's lifetime;
+                # compiled graphs write through it on every step
+                checkpointer_cm = AsyncSqliteSaver.from_conn_string(self.checkpoint_db)
+                checkpointer = await checkpointer_cm.__aenter__()
+                for pragma in _SQLITE_PRAGMAS:
+                    await checkpointer.conn.execute(pragma)
+                self._checkpointer_cm = checkpointer_cm
+                self._checkpointer = checkpointer
+        return self._checkpointer
+    
+    async def close(self):
+        """Close the checkpoint database connection and drop compiled graphs"""
+        self._compiled_graphs.clear()
+        checkpointer_cm = self._checkpointer_cm
+        self._checkpointer = self._checkpointer_cm = None
+        if checkpointer_cm is not None:
+            await checkpointer_cm.__aexit__(None, None, None)
+    
     async def build_feature_development_graph(self) -> Any:
         """
         Build the Feature Development workflow graph with parallel execution.
@@ -760,161 +777,118 @@ class LangGraphOrchestrator:
         4. [PARALLEL] QA Engineer → Testing + DevOps Engineer → Infrastructure
         5. Technical Writer → Documentation
         """
-        # Create checkpointer (use MemorySaver if AsyncSqliteSaver not available)
-        if AsyncSqliteSaver is None:
-            checkpointer = MemorySaver()
-            logger.info("Using MemorySaver for checkpointing (in-memory, not persisted across restarts)")
-        else:
-            checkpointer = await AsyncSqliteSaver.from_conn_string(self.checkpoint_db).__aenter__()
+        checkpointer = await self._get_checkpointer()
         
-        try:
-            # Create graph
-            workflow = StateGraph(MultiAgentState)
-            
-            # Add nodes
-            workflow.add_node("business_analyst", self.business_analyst_node)
-            workflow.add_node("architecture_design", self.developer_design_node)
-            workflow.add_node("implementation", self.developer_implementation_node)
-            workflow.add_node("qa_testing", self.qa_engineer_node)
-            workflow.add_node("infrastructure", self.devops_engineer_node)
-            workflow.add_node("documentation", self.technical_writer_node)
-            
-            # Define edges
-            workflow.set_entry_point("business_analyst")
-            workflow.add_edge("business_analyst", "architecture_design")
-            workflow.add_edge("architecture_design", "implementation")
-            
-            # Conditional routing after implementation with parallel execution
-            # The routing function returns Send objects for parallel execution
-            workflow.add_conditional_edges(
-                "implementation",
-                self.should_continue_after_implementation
-            )
-            
-            # Both QA and Infrastructure must complete before documentation
-            workflow.add_edge("qa_testing", "documentation")
-            workflow.add_edge("infrastructure", "documentation")
-            workflow.add_edge("documentation", END)
-            
-            # Compile with checkpointing
-            return workflow.compile(checkpointer=checkpointer)
-        finally:
-            # Clean up checkpointer if it was created
-            if checkpointer is not None and AsyncSqliteSaver is not None:
-                try:
-                    await checkpointer.__aexit__(None, None, None)
-                except:
-                    pass
+        # Create graph
+        workflow = StateGraph(MultiAgentState)
+        
+        # Add nodes
+        workflow.add_node("business_analyst", self.business_analyst_node)
+        workflow.add_node("architecture_design", self.developer_design_node)
+        workflow.add_node("implementation", self.developer_implementation_node)
+        workflow.add_node("qa_testing", self.qa_engineer_node)
+        workflow.add_node("infrastructure", self.devops_engineer_node)
+        workflow.add_node("documentation", self.technical_writer_node)
+        
+        # Define edges
+        workflow.set_entry_point("business_analyst")
+        workflow.add_edge("business_analyst", "architecture_design")
+        workflow.add_edge("architecture_design", "implementation")
+        
+        # Conditional routing after implementation with parallel execution
+        # The routing function returns Send objects for parallel execution
+        workflow.add_conditional_edges(
+            "implementation",
+            self.should_continue_after_implementation
+        )
+        
+        # Both QA and Infrastructure must complete before documentation
+        workflow.add_edge("qa_testing", "documentation")
+        workflow.add_edge("infrastructure", "documentation")
+        workflow.add_edge("documentation", END)
+        
+        # Compile with checkpointing
+        return workflow.compile(checkpointer=checkpointer)
+    
+    async def _run_bug_fix_step(
+        self,
+        spec: Tuple[str, str, str, str, str],
+        state: BugFixState
+    ) -> Dict[str, Any]:
+        """Run one bug-fix step (see _BUG_FIX_STEPS) with its agent"""
+        step, role, description, input_key, output_key = spec
+        task = Task(
+            task_id=f"{step}_{time.time()}",
+            description=description,
+            context={
+                "requirement": state["requirement"],
+                input_key: state.get(input_key, {}),
+                "task_type": step,
+            }
+        )
+        completed_task = await self._run_agent_task(self.agents[role], task)
+        result = completed_task.result or {}
+        update = {
+            output_key: result,
+            "files_created": result.get("files_created", []),
+            "current_step": step,
+            "completed_steps": [step],
+        }
+        if step == _BUG_FIX_STEPS[-1][0]:
+            update["status"] = "completed"
+        return update
     
     async def build_bug_fix_graph(self) -> Any:
         """Build Bug Fix workflow graph"""
-        if AsyncSqliteSaver is None:
-            checkpointer = MemorySaver()
-            logger.info("Using MemorySaver for checkpointing (in-memory, not persisted across restarts)")
-        else:
-            checkpointer = await AsyncSqliteSaver.from_conn_string(self.checkpoint_db).__aenter__()
+        checkpointer = await self._get_checkpointer()
         
-        try:
-            workflow = StateGraph(BugFixState)
-            
-            # For bug fix, we'll need simpler node implementations
-            # Using the same agents but different task types
-            
-            async def bug_analysis_node(state: BugFixState) -> Dict[str, Any]:
-                agent = self.agents["qa_engineer"]
-                task = Task(
-                    task_id=f"bug_analysis_{datetime.now().timestamp()}",
-                    description="Analyze and reproduce the bug",
-                    context={
-                        "requirement": state["requirement"],
-                        "bug_description": state["bug_description"],
-                        "task_type": "bug_analysis",
-                    }
-                )
-                completed_task = await agent.run_task(task)
-                return {
-                    "bug_analysis": completed_task.result or {},
-                    "files_created": completed_task.result.get("files_created", []) if completed_task.result else [],
-                    "current_step": "bug_analysis",
-                    "completed_steps": ["bug_analysis"],
-                }
-            
-            async def bug_fix_node(state: BugFixState) -> Dict[str, Any]:
-                agent = self.agents["developer"]
-                task = Task(
-                    task_id=f"bug_fix_{datetime.now().timestamp()}",
-                    description="Fix the bug",
-                    context={
-                        "requirement": state["requirement"],
-                        "bug_analysis": state.get("bug_analysis", {}),
-                        "task_type": "bug_fix",
-                    }
-                )
-                completed_task = await agent.run_task(task)
-                return {
-                    "bug_fix": completed_task.result or {},
-                    "files_created": completed_task.result.get("files_created", []) if completed_task.result else [],
-                    "current_step": "bug_fix",
-                    "completed_steps": ["bug_fix"],
-                }
-            
-            async def regression_testing_node(state: BugFixState) -> Dict[str, Any]:
-                agent = self.agents["qa_engineer"]
-                task = Task(
-                    task_id=f"regression_{datetime.now().timestamp()}",
-                    description="Run regression tests",
-                    context={
-                        "requirement": state["requirement"],
-                        "bug_fix": state.get("bug_fix", {}),
-                        "task_type": "regression_testing",
-                    }
-                )
-                completed_task = await agent.run_task(task)
-                return {
-                    "regression_tests": completed_task.result or {},
-                    "files_created": completed_task.result.get("files_created", []) if completed_task.result else [],
-                    "current_step": "regression_testing",
-                    "completed_steps": ["regression_testing"],
-                }
-            
-            async def release_notes_node(state: BugFixState) -> Dict[str, Any]:
-                agent = self.agents["technical_writer"]
-                task = Task(
-                    task_id=f"release_notes_{datetime.now().timestamp()}",
-                    description="Update release notes",
-                    context={
-                        "requirement": state["requirement"],
-                        "bug_fix": state.get("bug_fix", {}),
-                        "task_type": "release_notes",
-                    }
-                )
-                completed_task = await agent.run_task(task)
-                return {
-                    "release_notes": completed_task.result or {},
-                    "files_created": completed_task.result.get("files_created", []) if completed_task.result else [],
-                    "current_step": "release_notes",
-                    "completed_steps": ["release_notes"],
-                    "status": "completed"
-                }
-            
-            workflow.add_node("bug_analysis", bug_analysis_node)
-            workflow.add_node("bug_fix", bug_fix_node)
-            workflow.add_node("regression_testing", regression_testing_node)
-            workflow.add_node("release_notes", release_notes_node)
-            
-            workflow.set_entry_point("bug_analysis")
-            workflow.add_edge("bug_analysis", "bug_fix")
-            workflow.add_edge("bug_fix", "regression_testing")
-            workflow.add_edge("regression_testing", "release_notes")
-            workflow.add_edge("release_notes", END)
-            
-            return workflow.compile(checkpointer=checkpointer)
-        finally:
-            if checkpointer is not None and AsyncSqliteSaver is not None:
-                try:
-                    await checkpointer.__aexit__(None, None, None)
-                except:
-                    pass
+        workflow = StateGraph(BugFixState)
+        
+        # Same agents as feature development, with bug-fix task types;
+        # the steps run in table order
+        for spec in _BUG_FIX_STEPS:
+            workflow.add_node(spec[0], functools.partial(self._run_bug_fix_step, spec))
+        
+        workflow.set_entry_point(_BUG_FIX_STEPS[0][0])
+        for (step, *_), (next_step, *_) in zip(_BUG_FIX_STEPS, _BUG_FIX_STEPS[1:]):
+            workflow.add_edge(step, next_step)
+        workflow.add_edge(_BUG_FIX_STEPS[-1][0], END)
+        
+        return workflow.compile(checkpointer=checkpointer)
+    
+    async def _get_compiled_graph(self, workflow_type: str, builder) -> Any:
+        """Return the compiled graph for a workflow type, building it on first use"""
+        app = self._compiled_graphs.get(workflow_type)
+        if app is None:
+            async with self._graph_lock:
+                app = self._compiled_graphs.get(workflow_type)
+                if app is None:
+                    app = await builder()
+                    self._compiled_graphs[workflow_type] = app
+        return app
+    
+    @staticmethod
+    def _release_checkpoints(app: Any, config: Dict[str, Any]):
+        """
+        Drop a finished thread's in-memory checkpoints.
+        
+        Compiled graphs are cached, so a shared MemorySaver would otherwise
+        keep the full state history of every workflow run by this orchestrator.
+        Persistent checkpointers are left alone so threads can be resumed.
+        """
+        checkpointer = getattr(app, "checkpointer", None)
+        if not isinstance(checkpointer, MemorySaver):
+            return
+        # Older langgraph-checkpoint releases have no delete_thread; this runs
+        # in a finally block, so it must not mask the workflow's own outcome
+        delete_thread = getattr(checkpointer, "delete_thread", None)
+        if delete_thread is not None:
+            delete_thread(config["configurable"]["thread_id"])
+    
+    @staticmethod
+    def _make_run_config(thread_id: str) -> Dict[str, Any]:
+        """Build the LangGraph run config that selects a checkpoint thread"""
+        return {"configurable": {"thread_id": thread_id}}
     
     # ==================== Execution Methods ====================
     
@@ -943,7 +917,7 @@ class LangGraphOrchestrator:
         )
         
         workflow_id = initial_state["workflow_id"]
-        logger.info(f"Starting feature development workflow: {workflow_id}")
+        logger.info("Starting feature development workflow: %s", workflow_id)
         
         if self.chat_display:
             self.chat_display.print_header("Multi-Agent Feature Development Workflow")
@@ -954,55 +928,61 @@ class LangGraphOrchestrator:
             self.progress_tracker = ProgressTracker(total_steps=6)
         
         # Build graph
-        app = await self.build_feature_development_graph()
+        app = await self._get_compiled_graph(
+            "feature_development", self.build_feature_development_graph
+        )
         
         # Configure execution
-        config = {
-            "configurable": {
-                "thread_id": thread_id or workflow_id
-            }
-        }
+        config = self._make_run_config(thread_id or workflow_id)
         
         try:
             # Execute workflow with streaming for progress updates
             final_state = None
+            # Node events only carry each node's update; fold them into the
+            # full state so progress and saved results see every step
+            merged_state = dict(initial_state)
             async for event in app.astream(initial_state, config):
+                _merge_event(merged_state, event, _STATE_REDUCERS[MultiAgentState])
+                completed_steps = merged_state.get("completed_steps", [])
+                
                 # Log progress
                 for node_name, node_state in event.items():
-                    logger.info(f"[{workflow_id}] Completed node: {node_name}")
+                    logger.info("[%s] Completed node: %s", workflow_id, node_name)
                     
                     # Update progress tracker with actual completed steps from state
-                    if self.progress_tracker and node_state.get("completed_steps"):
-                        self.progress_tracker.update_with_count(node_state.get("completed_steps", []))
+                    if self.progress_tracker and completed_steps:
+                        self.progress_tracker.update_with_count(completed_steps)
                     
-                    if self.chat_display and "current_step" in node_state:
-                        logger.info(f"[{workflow_id}] Current step: {node_state['current_step']}")
+                    if self.chat_display and node_state and "current_step" in node_state:
+                        logger.info("[%s] Current step: %s", workflow_id, node_state["current_step"])
                         
                         # Show workflow status for every node completion
                         self.chat_display.workflow_status(
                             workflow_id,
                             node_state.get("status", "running"),
                             node_state.get("current_step", "unknown"),
-                            node_state.get("completed_steps", [])
+                            completed_steps
                         )
                 
                 final_state = event
             
             # Save results
-            await self._save_workflow_results(workflow_id, final_state)
+            await self._save_workflow_results(workflow_id, merged_state)
             
             # Save chat log if enabled
             if self.chat_display:
-                output_dir = Path(self.workspace) / "output"
-                chat_log_path = output_dir / f"chat_log_{workflow_id}.json"
-                self.chat_display.save_chat_log(chat_log_path)
+                chat_log_path = self.output_dir / f"chat_log_{workflow_id}.json"
+                await asyncio.to_thread(self.chat_display.save_chat_log, chat_log_path)
                 self.chat_display.conversation_summary()
             
             return final_state
             
         except Exception as e:
-            logger.error(f"Error executing workflow {workflow_id}: {e}", exc_info=True)
+            # No traceback here: the exception is re-raised and the caller logs it
+            logger.error("Error executing workflow %s: %s", workflow_id, e)
             raise
+        finally:
+            self._release_checkpoints(app, config)
     
     async def execute_bug_fix(
         self,
@@ -1017,58 +997,82 @@ class LangGraphOrchestrator:
         )
         
         workflow_id = initial_state["workflow_id"]
-        logger.info(f"Starting bug fix workflow: {workflow_id}")
+        logger.info("Starting bug fix workflow: %s", workflow_id)
         
-        app = await self.build_bug_fix_graph()
+        app = await self._get_compiled_graph("bug_fix", self.build_bug_fix_graph)
         
-        config = {
-            "configurable": {
-                "thread_id": thread_id or workflow_id
-            }
-        }
+        config = self._make_run_config(thread_id or workflow_id)
         
         try:
             final_state = None
+            # Log node names only, in batches; repr() of the full state can
+            # be very large and used to be built on every step
+            progress = _ProgressBatcher(workflow_id)
+            merged_state = dict(initial_state)
             async for event in app.astream(initial_state, config):
-                logger.info(f"[{workflow_id}] Progress: {event}")
+                progress.add(event)
+                _merge_event(merged_state, event, _STATE_REDUCERS[BugFixState])
                 final_state = event
+            progress.flush()
             
-            await self._save_workflow_results(workflow_id, final_state)
+            await self._save_workflow_results(workflow_id, merged_state)
             return final_state
             
         except Exception as e:
-            logger.error(f"Error executing bug fix workflow {workflow_id}: {e}", exc_info=True)
+            # No traceback here: the exception is re-raised and the caller logs it
+            logger.error("Error executing bug fix workflow %s: %s", workflow_id, e)
             raise
+        finally:
+            self._release_checkpoints(app, config)
     
     async def _save_workflow_results(
         self,
         workflow_id: str,
-        final_state: Dict[str, Any]
+        state: Optional[Dict[str, Any]]
     ):
-        """Save workflow results to JSON file"""
-        output_dir = Path(self.workspace) / "output"
-        output_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Get the last state from the event stream
-        # The final_state is a dict with node_name: state
-        actual_state = list(final_state.values())[0] if final_state else {}
-        
+        """Save a summary of the merged workflow state to a JSON file"""
+        get = (state or {}).get
         result = {
             "workflow_id": workflow_id,
-            "workflow_type": actual_state.get("workflow_type", "unknown"),
-            "status": actual_state.get("status", "completed"),
-            "requirement": actual_state.get("requirement", ""),
-            "completed_steps": actual_state.get("completed_steps", []),
-            "files_created": actual_state.get("files_created", []),
-            "errors": actual_state.get("errors", []),
-            "started_at": actual_state.get("started_at", ""),
-            "completed_at": actual_state.get("completed_at", datetime.now().isoformat()),
+            "workflow_type": get("workflow_type", "unknown"),
+            "status": get("status", "completed"),
+            "requirement": get("requirement", ""),
+            "completed_steps": get("completed_steps", []),
+            "files_created": get("files_created", []),
+            "errors": get("errors", []),
+            "started_at": get("started_at", ""),
+            # Only stamp the time when the workflow did not record one
+            "completed_at": get("completed_at") or datetime.now().isoformat(),
         }
         
         filename = f"langgraph_{workflow_id}.json"
-        filepath = output_dir / filename
+        filepath = self.output_dir / filename
+        
+        # Serialize and write off the event loop so concurrent workflows keep running
+        await asyncio.to_thread(self._write_json_file, filepath, result)
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(result, f, indent=2, default=str)
+        logger.info("Saved workflow results to: %s", filepath)
+    
+    @staticmethod
+    def _write_json_file(filepath: Path, data: Dict[str, Any]) -> None:
+        """Write data as indented JSON (blocking; run via asyncio.to_thread)"""
+        # Serialize fully in memory first so the file is written in one call
+        # rather than one small write per token as json.dump does
+        if orjson is not None:
+            payload = orjson.dumps(
+                data,
+                default=_json_default,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            )
+        else:
+            payload = json.dumps(data, indent=2, default=_json_default).encode('utf-8')
         
-        logger.info(f"Saved workflow results to: {filepath}")
+        # Write to a sibling temp file and rename it into place so readers never
+        # see a truncated results file if the process dies mid-write
+        tmp_path = filepath.with_name(f"{filepath.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            tmp_path.write_bytes(payload)
+            os.replace(tmp_path, filepath)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
@@ -11,12 +11,28 @@ import operator
 from datetime import datetime
 
 
+def add_unique(left: List[Any], right: List[Any]) -> List[Any]:
+    """
+    Reducer that appends new items, skipping ones already present.
+    
+    Used for files_created: agents that rewrite a file report it again, and
+    with operator.add every duplicate was stored in each later checkpoint.
+    """
+    merged = list(left)
+    seen = set(left)
+    for item in right:
+        if item not in seen:
+            seen.add(item)
+            merged.append(item)
+    return merged
+
+
 class MultiAgentState(TypedDict):
     """
     State definition for multi-agent workflows.
     
-    Uses Annotated types with operator.add to automatically merge
-    results from multiple agents into lists.
+    Agent outputs hold the latest result of each step; the metadata lists
+    use Annotated reducers to merge updates from multiple agents.
     """
     # Input
     requirement: str
@@ -24,17 +40,17 @@ class MultiAgentState(TypedDict):
     workflow_id: str
     context: NotRequired[Dict[str, Any]]
     
-    # Agent outputs (using operator.add for automatic list merging)
-    business_analysis: NotRequired[Annotated[List[Dict[str, Any]], operator.add]]
-    architecture: NotRequired[Annotated[List[Dict[str, Any]], operator.add]]
-    implementation: NotRequired[Annotated[List[Dict[str, Any]], operator.add]]
-    tests: NotRequired[Annotated[List[Dict[str, Any]], operator.add]]
-    infrastructure: NotRequired[Annotated[List[Dict[str, Any]], operator.add]]
-    documentation: NotRequired[Annotated[List[Dict[str, Any]], operator.add]]
+    # Agent outputs (each written once, by its own node)
+    business_analysis: NotRequired[Dict[str, Any]]
+    architecture: NotRequired[Dict[str, Any]]
+    implementation: NotRequired[Dict[str, Any]]
+    tests: NotRequired[Dict[str, Any]]
+    infrastructure: NotRequired[Dict[str, Any]]
+    documentation: NotRequired[Dict[str, Any]]
     
     # Workflow metadata
     errors: Annotated[List[Dict[str, Any]], operator.add]
-    files_created: Annotated[List[str], operator.add]
+    files_created: Annotated[List[str], add_unique]
     current_step: str
     completed_steps: Annotated[List[str], operator.add]
     
@@ -64,7 +80,7 @@ class BugFixState(TypedDict):
     
     # Metadata
     errors: Annotated[List[Dict[str, Any]], operator.add]
-    files_created: Annotated[List[str], operator.add]
+    files_created: Annotated[List[str], add_unique]
     current_step: str
     completed_steps: Annotated[List[str], operator.add]
     status: str
@@ -85,7 +101,7 @@ class InfrastructureState(TypedDict):
     
     # Metadata
     errors: Annotated[List[Dict[str, Any]], operator.add]
-    files_created: Annotated[List[str], operator.add]
+    files_created: Annotated[List[str], add_unique]
     current_step: str
     completed_steps: Annotated[List[str], operator.add]
     status: str
@@ -106,7 +122,7 @@ class AnalysisState(TypedDict):
     
     # Metadata
     errors: Annotated[List[Dict[str, Any]], operator.add]
-    files_created: Annotated[List[str], operator.add]
+    files_created: Annotated[List[str], add_unique]
     current_step: str
     completed_steps: Annotated[List[str], operator.add]
     status: str
@@ -130,8 +146,10 @@ def create_initial_state(
     Returns:
         Initial state dictionary
     """
+    # One timestamp for both the generated ID and started_at
+    now = datetime.now()
     if workflow_id is None:
-        workflow_id = f"workflow_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        workflow_id = f"workflow_{now.strftime('%Y%m%d_%H%M%S')}"
     
     return {
         "requirement": requirement,
@@ -143,7 +161,7 @@ def create_initial_state(
         "current_step": "start",
         "completed_steps": [],
         "status": "running",
-        "started_at": datetime.now().isoformat(),
+        "started_at": now.isoformat(),
     }
 
 
@@ -1,8 +1,9 @@
 import asyncio
 import logging
-from typing import Dict, List, Optional, Any, Set
+from typing import Dict, List, Optional, Any, Set, Callable, Awaitable
 from datetime import datetime
 from collections import defaultdict
+from graphlib import TopologicalSorter, CycleError
 from ..agents.base_agent import Task, AgentStatus
 
 logger = logging.getLogger(__name__)
@@ -14,13 +15,22 @@ class TaskManager:
         self.task_queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
         self.completed_tasks: Set[str] = set()
         self.failed_tasks: Set[str] = set()
+        # "pending" / "completed" / "failed", kept in step with the sets above
+        self.task_status: Dict[str, str] = {}
         self.task_dependencies: Dict[str, List[str]] = defaultdict(list)
+        # Reverse of task_dependencies: dependency id -> ids of tasks waiting on it
+        self.task_dependents: Dict[str, List[str]] = defaultdict(list)
     
     def add_task(self, task: Task) -> None:
         self.tasks[task.task_id] = task
+        self.task_status.setdefault(task.task_id, "pending")
         
         if task.dependencies:
             self.task_dependencies[task.task_id] = task.dependencies
+            for dep_id in dict.fromkeys(task.dependencies):
+                dependents = self.task_dependents[dep_id]
+                if task.task_id not in dependents:
+                    dependents.append(task.task_id)
         
         logger.info(f"Added task {task.task_id} with priority {task.priority}")
     
@@ -33,10 +43,12 @@ class TaskManager:
         logger.info(f"Enqueued task {task.task_id}")
     
     async def get_next_task(self) -> Optional[Task]:
-        if self.task_queue.empty():
+        # get_nowait() instead of empty() + get(): no await, and no window in
+        # which another consumer can drain the queue between the two calls
+        try:
+            _, task_id, task = self.task_queue.get_nowait()
+        except asyncio.QueueEmpty:
             return None
-        
-        _, task_id, task = await self.task_queue.get()
         return task
     
     def _check_dependencies_met(self, task_id: str) -> bool:
@@ -50,37 +62,139 @@ class TaskManager:
     
     def mark_completed(self, task_id: str) -> None:
         self.completed_tasks.add(task_id)
+        self.task_status[task_id] = "completed"
         logger.info(f"Task {task_id} marked as completed")
         
         self._check_dependent_tasks(task_id)
     
     def mark_failed(self, task_id: str) -> None:
         self.failed_tasks.add(task_id)
+        self.task_status[task_id] = "failed"
         logger.error(f"Task {task_id} marked as failed")
     
     def _check_dependent_tasks(self, completed_task_id: str) -> None:
-        for task_id, dependencies in self.task_dependencies.items():
-            if completed_task_id in dependencies and task_id not in self.completed_tasks:
+        # Only the tasks that depend on the completed one can have become ready
+        for task_id in self.task_dependents.get(completed_task_id, ()):
+            if task_id not in self.completed_tasks:
                 if self._check_dependencies_met(task_id):
                     task = self.tasks.get(task_id)
                     if task:
                         asyncio.create_task(self.enqueue_task(task))
     
+    def validate_task_graph(self) -> None:
+        """
+        Validate the dependency graph of all added tasks before running any.
+        
+        Raises:
+            ValueError: Listing every unknown dependency and any dependency cycle
+        """
+        errors: List[str] = [
+            f"task {task_id} depends on unknown task {dep_id}"
+            for task_id, task in self.tasks.items()
+            for dep_id in task.dependencies
+            if dep_id not in self.tasks
+        ]
+        
+        try:
+            TopologicalSorter({
+                task_id: task.dependencies for task_id, task in self.tasks.items()
+            }).prepare()
+        except CycleError as e:
+            errors.append(f"dependency cycle: {' -> '.join(e.args[1])}")
+        
+        if errors:
+            raise ValueError(
+                "Invalid task graph:\n" + "\n".join(f"  - {error}" for error in errors)
+            )
+    
+    async def execute_tasks(
+        self,
+        executor: Callable[[Task], Awaitable[Task]]
+    ) -> Dict[str, Task]:
+        """
+        Execute all added tasks in dependency order.
+        
+        Each task is started as soon as its own dependencies have finished,
+        independently of unrelated slower tasks, so agent calls overlap as
+        much as the dependency graph allows. Tasks whose dependencies failed
+        are marked failed without being executed.
+        
+        Args:
+            executor: Coroutine function that runs a task and returns it
+                (e.g. BaseAgent.run_task); task.error marks a failure
+        
+        Returns:
+            Dictionary of finished tasks keyed by task_id
+        
+        Raises:
+            ValueError: If the task graph is invalid (see validate_task_graph)
+        """
+        self.validate_task_graph()
+        
+        # Successor lists and outstanding dependency counts
+        successors: Dict[str, List[str]] = defaultdict(list)
+        remaining: Dict[str, int] = {}
+        for task_id, task in self.tasks.items():
+            dependencies = set(task.dependencies)
+            remaining[task_id] = len(dependencies)
+            for dep_id in dependencies:
+                successors[dep_id].append(task_id)
+        
+        results: Dict[str, Task] = {}
+        running: Dict[asyncio.Task, str] = {}
+        ready = [task_id for task_id, count in remaining.items() if count == 0]
+        
+        try:
+            while ready or running:
+                finished: List[str] = []
+                
+                for task_id in sorted(ready, key=lambda task_id: -self.tasks[task_id].priority):
+                    task = self.tasks[task_id]
+                    failed_deps = [dep_id for dep_id in task.dependencies if dep_id in self.failed_tasks]
+                    if failed_deps:
+                        task.error = f"Dependencies failed: {failed_deps}"
+                        results[task_id] = task
+                        self.mark_failed(task_id)
+                        finished.append(task_id)
+                    else:
+                        running[asyncio.create_task(executor(task))] = task_id
+                ready = []
+                
+                if not finished:
+                    done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                    for future in done:
+                        task_id = running.pop(future)
+                        task = future.result()
+                        results[task_id] = task
+                        if task.error:
+                            self.mark_failed(task_id)
+                        else:
+                            # Not mark_completed(): dependents are scheduled here, not via task_queue
+                            self.completed_tasks.add(task_id)
+                            self.task_status[task_id] = "completed"
+                            logger.info(f"Task {task_id} marked as completed")
+                        finished.append(task_id)
+                
+                for task_id in finished:
+                    for successor_id in successors[task_id]:
+                        remaining[successor_id] -= 1
+                        if remaining[successor_id] == 0:
+                            ready.append(successor_id)
+        finally:
+            for future in running:
+                future.cancel()
+        
+        return results
+    
     def get_task_status(self, task_id: str) -> Optional[Dict[str, Any]]:
         task = self.tasks.get(task_id)
         if not task:
             return None
         
-        status = "pending"
-        if task_id in self.completed_tasks:
-            status = "completed"
-        elif task_id in self.failed_tasks:
-            status = "failed"
-        
         return {
             "task_id": task.task_id,
             "description": task.description,
-            "status": status,
+            "status": self.task_status.get(task_id, "pending"),
             "priority": task.priority,
             "dependencies": task.dependencies,
             "created_at": task.created_at.isoformat(),
@@ -95,7 +209,7 @@ class TaskManager:
             "pending": len(self.tasks) - len(self.completed_tasks) - len(self.failed_tasks),
             "tasks": {
                 task_id: self.get_task_status(task_id)
-                for task_id in self.tasks.keys()
+                for task_id in self.tasks
             }
         }
     
@@ -106,16 +220,10 @@ class TaskManager:
         }
         
         for task_id, task in self.tasks.items():
-            status = "pending"
-            if task_id in self.completed_tasks:
-                status = "completed"
-            elif task_id in self.failed_tasks:
-                status = "failed"
-            
             graph["nodes"].append({
                 "id": task_id,
                 "description": task.description,
-                "status": status,
+                "status": self.task_status.get(task_id, "pending"),
                 "priority": task.priority
             })
             
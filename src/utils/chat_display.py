@@ -114,13 +114,12 @@ class AgentChatDisplay:
             to_name = to_agent.replace("_", " ").title()
             to_text = f" → {to_color}{Style.BRIGHT}{to_name}{Style.RESET_ALL}"
         
-        # Print the message
-        print(f"{timestamp}{icon} {color}{Style.BRIGHT}{agent_name}{Style.RESET_ALL}{to_text}:")
-        
-        # Indent the message content
-        for line in message.split('\n'):
-            if line.strip():
-                print(f"  {color}{line}{Style.RESET_ALL}")
+        # Print the header and indented message content in a single write
+        body = "".join(
+            f"\n  {color}{line}{Style.RESET_ALL}"
+            for line in message.split('\n') if line.strip()
+        )
+        print(f"{timestamp}{icon} {color}{Style.BRIGHT}{agent_name}{Style.RESET_ALL}{to_text}:{body}")
         
         # Store in history
         self.message_history.append({
@@ -182,12 +181,6 @@ class AgentChatDisplay:
         unique_steps = set(completed_steps) if completed_steps else set()
         steps_count = len(unique_steps)
         
-        print(f"\n{timestamp}{self.ICONS['info']} {Style.BRIGHT}Workflow Status{Style.RESET_ALL}")
-        print(f"  ID: {Fore.LIGHTBLACK_EX}{workflow_id}{Style.RESET_ALL}")
-        print(f"  Status: {status_color}{status}{Style.RESET_ALL}")
-        print(f"  Current Step: {Fore.CYAN}{step}{Style.RESET_ALL}")
-        print(f"  Progress: {steps_count} steps completed")
-        
         # Show progress bar based on unique steps
         total_steps = 6  # Typical workflow steps
         progress = min(steps_count, total_steps)
@@ -196,12 +189,21 @@ class AgentChatDisplay:
         bar = "█" * filled + "░" * (bar_length - filled)
         percentage = int((progress / total_steps) * 100)
         
-        print(f"  {Fore.CYAN}{bar}{Style.RESET_ALL} {percentage}%")
-        
         # Show which steps are completed
+        completed_line = ""
         if unique_steps:
             completed_list = ", ".join(sorted(unique_steps))
-            print(f"  {Fore.LIGHTBLACK_EX}Completed: {completed_list}{Style.RESET_ALL}")
+            completed_line = f"\n  {Fore.LIGHTBLACK_EX}Completed: {completed_list}{Style.RESET_ALL}"
+        
+        print(
+            f"\n{timestamp}{self.ICONS['info']} {Style.BRIGHT}Workflow Status{Style.RESET_ALL}\n"
+            f"  ID: {Fore.LIGHTBLACK_EX}{workflow_id}{Style.RESET_ALL}\n"
+            f"  Status: {status_color}{status}{Style.RESET_ALL}\n"
+            f"  Current Step: {Fore.CYAN}{step}{Style.RESET_ALL}\n"
+            f"  Progress: {steps_count} steps completed\n"
+            f"  {Fore.CYAN}{bar}{Style.RESET_ALL} {percentage}%"
+            f"{completed_line}"
+        )
     
     def inter_agent_communication(
         self,
@@ -3,12 +3,15 @@ Connection pool manager for LLM API clients.
 Provides connection reuse, health checking, and graceful degradation.
 """
 import asyncio
+import functools
 import logging
-from typing import Dict, Optional, Any
+from typing import Dict, Optional, Any, TYPE_CHECKING
 from datetime import datetime, timedelta
-from openai import AsyncOpenAI
 import os
 
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
+
 logger = logging.getLogger(__name__)
 
 
@@ -31,7 +34,7 @@ class LLMClientPool:
         if self._initialized:
             return
         
-        self.clients: Dict[str, AsyncOpenAI] = {}
+        self.clients: Dict[str, 'AsyncOpenAI'] = {}
         self.client_health: Dict[str, Dict[str, Any]] = {}
         self.health_check_interval = 300  # 5 minutes
         self._initialized = True
@@ -43,7 +46,7 @@ class LLMClientPool:
         api_base: Optional[str] = None,
         api_key: Optional[str] = None,
         timeout: float = 300.0
-    ) -> AsyncOpenAI:
+    ) -> 'AsyncOpenAI':
         """
         Get or create an LLM API client.
         
@@ -76,6 +79,8 @@ class LLMClientPool:
             if cache_key in self.clients:
                 return self.clients[cache_key]
             
+            from openai import AsyncOpenAI
+            
             logger.info(f"Creating new LLM client for {api_base}")
             client = AsyncOpenAI(
                 base_url=api_base,
@@ -196,15 +201,17 @@ class LLMClientPool:
         logger.info("All LLM clients closed")
 
 
-# Global instance
-_client_pool = LLMClientPool()
+@functools.lru_cache(maxsize=1)
+def _get_client_pool() -> LLMClientPool:
+    """Create the global pool on first use instead of at import time"""
+    return LLMClientPool()
 
 
 async def get_llm_client(
     api_base: Optional[str] = None,
     api_key: Optional[str] = None,
     timeout: float = 300.0
-) -> AsyncOpenAI:
+) -> 'AsyncOpenAI':
     """
     Get an LLM API client from the pool.
     
@@ -216,14 +223,14 @@ async def get_llm_client(
     Returns:
         Configured AsyncOpenAI client
     """
-    return await _client_pool.get_client(api_base, api_key, timeout)
+    return await _get_client_pool().get_client(api_base, api_key, timeout)
 
 
 def get_pool_stats() -> Dict[str, Any]:
     """Get statistics about the client pool"""
-    return _client_pool.get_stats()
+    return _get_client_pool().get_stats()
 
 
 async def close_client_pool():
     """Close the client pool and all connections"""
-    await _client_pool.close_all()
+    await _get_client_pool().close_all()
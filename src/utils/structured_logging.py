@@ -5,7 +5,7 @@ import logging
 import json
 import sys
 from typing import Any, Dict, Optional
-from datetime import datetime
+from datetime import datetime, timezone
 import uuid
 from contextvars import ContextVar
 
@@ -21,7 +21,7 @@ class StructuredFormatter(logging.Formatter):
     
     def format(self, record: logging.LogRecord) -> str:
         log_data = {
-            'timestamp': datetime.utcnow().isoformat() + 'Z',
+            'timestamp': datetime.fromtimestamp(record.created, timezone.utc).isoformat().replace('+00:00', 'Z'),
             'level': record.levelname,
             'logger': record.name,
             'message': record.getMessage(),
@@ -0,0 +1,65 @@
+"""Tests for BaseAgent LLM call handling that do not need an LLM server"""
+import asyncio
+
+import pytest
+
+from src.agents import BusinessAnalystAgent
+from src.agents import base_agent
+
+
+@pytest.fixture
+def agent(tmp_path, monkeypatch):
+    monkeypatch.setenv('OPENAI_API_BASE', 'http://127.0.0.1:9/v1')
+    monkeypatch.setenv('LLM_RESPONSE_CACHE_SIZE', '1')
+    monkeypatch.setattr(base_agent, '_llm_response_cache', base_agent.OrderedDict())
+
+    agent = BusinessAnalystAgent(agent_id="ba_test", workspace=str(tmp_path))
+    agent.calls = []
+
+    async def fake_call(system_prompt, user_prompt, timeout, retry_count=0, stream=False, stream_callback=None):
+        agent.calls.append(user_prompt)
+        return {"success": True, "stdout": f"answer to {user_prompt}", "stderr": "", "returncode": 0}
+
+    agent._call_local_llama_server = fake_call
+    return agent
+
+
+def test_identical_prompts_reuse_cached_response(agent):
+    first = asyncio.run(agent.execute_llm_task("same prompt"))
+    second = asyncio.run(agent.execute_llm_task("same prompt"))
+
+    assert agent.calls == ["same prompt"]
+    assert second == first
+
+
+def test_response_cache_evicts_least_recently_used(agent):
+    asyncio.run(agent.execute_llm_task("first"))
+    asyncio.run(agent.execute_llm_task("second"))
+    asyncio.run(agent.execute_llm_task("first"))
+
+    assert agent.calls == ["first", "second", "first"]
+
+
+def test_response_cache_disabled_by_default(agent, monkeypatch):
+    monkeypatch.delenv('LLM_RESPONSE_CACHE_SIZE')
+
+    assert BusinessAnalystAgent("ba_other", agent.workspace).response_cache_size == 0
+
+
+def test_response_cache_key_includes_sampling_settings(agent, monkeypatch):
+    asyncio.run(agent.execute_llm_task("same prompt"))
+    monkeypatch.setenv('OPENAI_TEMPERATURE', '0.1')
+    asyncio.run(agent.execute_llm_task("same prompt"))
+    monkeypatch.setenv('OPENAI_MAX_TOKENS', '512')
+    asyncio.run(agent.execute_llm_task("same prompt"))
+
+    assert agent.calls == ["same prompt"] * 3
+
+
+def test_cached_response_is_sent_to_stream_callback(agent):
+    chunks = []
+    first = asyncio.run(agent.execute_llm_task("same prompt"))
+    asyncio.run(agent.execute_llm_task("same prompt", stream=True, stream_callback=chunks.append))
+
+    assert agent.calls == ["same prompt"]
+    assert chunks == [first["stdout"]]
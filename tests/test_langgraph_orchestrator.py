@@ -0,0 +1,332 @@
+"""Tests for LangGraphOrchestrator helpers that do not need an LLM server"""
+import asyncio
+import json
+from datetime import datetime
+
+import pytest
+
+from src.orchestrator import langgraph_orchestrator
+from src.orchestrator.langgraph_orchestrator import LangGraphOrchestrator
+
+
+@pytest.fixture
+def orchestrator(tmp_path):
+    return LangGraphOrchestrator(
+        workspace=str(tmp_path),
+        config={},
+        enable_chat_display=False
+    )
+
+
+def test_save_workflow_results_writes_summary(orchestrator, tmp_path):
+    state = {
+        "workflow_type": "feature_development",
+        "status": "completed",
+        "requirement": "Build an API",
+        "completed_steps": ["business_analyst", "documentation"],
+        "files_created": ["README.md"],
+        "errors": [],
+        "started_at": "2024-01-01T00:00:00",
+        "completed_at": "2024-01-01T00:05:00",
+    }
+
+    asyncio.run(orchestrator._save_workflow_results("wf_test", state))
+
+    saved = json.loads((tmp_path / "output" / "langgraph_wf_test.json").read_text())
+    assert saved["workflow_id"] == "wf_test"
+    assert saved["status"] == "completed"
+    assert saved["files_created"] == ["README.md"]
+    assert saved["completed_at"] == "2024-01-01T00:05:00"
+
+
+def test_save_workflow_results_handles_empty_state(orchestrator, tmp_path):
+    asyncio.run(orchestrator._save_workflow_results("wf_empty", None))
+
+    saved = json.loads((tmp_path / "output" / "langgraph_wf_empty.json").read_text())
+    assert saved["workflow_type"] == "unknown"
+    assert saved["completed_at"]
+
+
+def test_write_json_file_without_orjson(tmp_path, monkeypatch):
+    monkeypatch.setattr(langgraph_orchestrator, "orjson", None)
+    filepath = tmp_path / "result.json"
+
+    LangGraphOrchestrator._write_json_file(filepath, {"value": 1, "when": tmp_path})
+
+    assert json.loads(filepath.read_text()) == {"value": 1, "when": str(tmp_path)}
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_write_json_file_encodes_datetimes_consistently(tmp_path, monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(langgraph_orchestrator, "orjson", None)
+    elif langgraph_orchestrator.orjson is None:
+        pytest.skip("orjson not installed")
+    filepath = tmp_path / "result.json"
+    when = datetime(2024, 1, 1, 12, 30, 5)
+
+    LangGraphOrchestrator._write_json_file(filepath, {"when": when})
+
+    assert json.loads(filepath.read_text()) == {"when": "2024-01-01T12:30:05"}
+
+
+def test_progress_batcher_coalesces_events(caplog):
+    batcher = langgraph_orchestrator._ProgressBatcher("wf_batch", max_items=3, max_interval=60)
+
+    with caplog.at_level("INFO", logger=langgraph_orchestrator.__name__):
+        for node_name in ("bug_analysis", "bug_fix", "regression_testing", "release_notes"):
+            batcher.add({node_name: {}})
+        batcher.flush()
+        batcher.flush()
+
+    messages = [record.getMessage() for record in caplog.records]
+    assert messages == [
+        "[wf_batch] Progress: 3 events, last_node=regression_testing",
+        "[wf_batch] Progress: 1 events, last_node=release_notes",
+    ]
+
+
+def test_compiled_graph_is_built_once(orchestrator):
+    builds = []
+    original = orchestrator.build_bug_fix_graph
+
+    async def counting_build():
+        builds.append(1)
+        return await original()
+
+    async def get_twice():
+        return await asyncio.gather(
+            orchestrator._get_compiled_graph("bug_fix", counting_build),
+            orchestrator._get_compiled_graph("bug_fix", counting_build),
+        )
+
+    first, second = asyncio.run(get_twice())
+
+    assert first is second
+    assert len(builds) == 1
+
+
+def test_write_json_file_replaces_atomically(tmp_path):
+    filepath = tmp_path / "result.json"
+    filepath.write_text("stale")
+
+    LangGraphOrchestrator._write_json_file(filepath, {"value": 2})
+
+    assert json.loads(filepath.read_text()) == {"value": 2}
+    assert [p.name for p in tmp_path.iterdir()] == ["result.json"]
+
+
+def test_execute_bug_fix_releases_memory_checkpoints(orchestrator, monkeypatch):
+    async def fake_run_task(task):
+        task.result = {"summary": task.description, "files_created": []}
+        return task
+
+    for agent in orchestrator.agents.values():
+        monkeypatch.setattr(agent, "run_task", fake_run_task)
+
+    async def run():
+        final_state = await orchestrator.execute_bug_fix("Fix login", "Login fails")
+        app = await orchestrator._get_compiled_graph("bug_fix", orchestrator.build_bug_fix_graph)
+        return final_state, app
+
+    final_state, app = asyncio.run(run())
+
+    assert final_state["release_notes"]["status"] == "completed"
+    if isinstance(app.checkpointer, langgraph_orchestrator.MemorySaver):
+        assert not app.checkpointer.storage
+
+
+def test_release_checkpoints_tolerates_saver_without_delete_thread(monkeypatch):
+    class OldMemorySaver(langgraph_orchestrator.MemorySaver):
+        def __getattribute__(self, name):
+            if name == "delete_thread":
+                raise AttributeError(name)
+            return super().__getattribute__(name)
+
+    class App:
+        checkpointer = OldMemorySaver()
+
+    LangGraphOrchestrator._release_checkpoints(App(), {"configurable": {"thread_id": "t1"}})
+
+
+def test_graphs_share_one_checkpointer_until_closed(orchestrator):
+    async def build_and_close():
+        feature = await orchestrator.build_feature_development_graph()
+        bug_fix = await orchestrator.build_bug_fix_graph()
+        await orchestrator.close()
+        return feature, bug_fix
+
+    feature, bug_fix = asyncio.run(build_and_close())
+
+    assert feature.checkpointer is bug_fix.checkpointer
+    assert orchestrator._checkpointer is None
+    assert orchestrator._compiled_graphs == {}
+
+
+def test_parallel_branches_receive_only_the_keys_they_read(orchestrator, monkeypatch):
+    seen_contexts = {}
+
+    async def fake_run_task(task):
+        seen_contexts[task.context["task_type"]] = task.context
+        task.result = {"status": "completed", "files_created": []}
+        return task
+
+    for agent in orchestrator.agents.values():
+        monkeypatch.setattr(agent, "run_task", fake_run_task)
+
+    state = {
+        "workflow_id": "wf_send",
+        "requirement": "Build an API",
+        "workflow_type": "feature_development",
+        "implementation": {"status": "completed"},
+        "business_analysis": {"large": "x" * 1000},
+        "errors": [],
+    }
+    sends = orchestrator.should_continue_after_implementation(state)
+
+    assert [send.node for send in sends] == ["qa_testing", "infrastructure"]
+    for send in sends:
+        assert set(send.arg) == set(langgraph_orchestrator._PARALLEL_BRANCH_KEYS)
+
+    asyncio.run(orchestrator.execute_feature_development("Build an API"))
+
+    # Branch results still reach the join node through the full graph state
+    assert seen_contexts["testing"]["implementation"] == {"status": "completed", "files_created": []}
+    assert seen_contexts["documentation"]["tests"] == {"status": "completed", "files_created": []}
+    assert seen_contexts["documentation"]["infrastructure"] == {"status": "completed", "files_created": []}
+
+
+def test_agent_node_records_exceptions_as_step_failures(orchestrator, monkeypatch):
+    async def failing_run_task(task):
+        raise RuntimeError("LLM unavailable")
+
+    monkeypatch.setattr(orchestrator.agents["developer"], "run_task", failing_run_task)
+    monkeypatch.setattr(orchestrator.agents["qa_engineer"], "run_task", failing_run_task)
+    state = {
+        "workflow_id": "wf_fail",
+        "requirement": "Build an API",
+        "workflow_type": "feature_development",
+        "implementation": {},
+    }
+
+    implementation = asyncio.run(orchestrator.developer_implementation_node(state))
+    qa = asyncio.run(orchestrator.qa_engineer_node(state))
+
+    assert implementation["status"] == "failed"
+    assert implementation["current_step"] == "implementation"
+    assert implementation["errors"][0]["error"] == "LLM unavailable"
+    # Parallel branches leave the single-value keys to the join node
+    assert qa["completed_steps"] == ["qa_testing"]
+    assert "status" not in qa and "current_step" not in qa
+
+
+def test_disabled_chat_display_is_a_falsy_no_op(orchestrator):
+    assert not orchestrator.chat_display
+    assert orchestrator.chat_display.agent_message("developer", "hello", message_type="start") is None
+
+
+def test_route_after_parallel(orchestrator):
+    done = ["implementation", "qa_testing", "infrastructure"]
+
+    assert orchestrator.route_after_parallel({"completed_steps": done, "errors": []}) == "documentation"
+    assert orchestrator.route_after_parallel({"completed_steps": done[:2], "errors": []}) == "failed"
+    assert orchestrator.route_after_parallel({
+        "completed_steps": done,
+        "errors": [{"step": "infrastructure", "error": "boom"}],
+    }) == "failed"
+
+
+def test_agent_tasks_respect_max_concurrent_agents(tmp_path, monkeypatch):
+    orchestrator = LangGraphOrchestrator(
+        workspace=str(tmp_path),
+        config={"max_concurrent_agents": 1},
+        enable_chat_display=False
+    )
+    active = []
+    peak = []
+
+    async def slow_run_task(task):
+        active.append(task)
+        peak.append(len(active))
+        await asyncio.sleep(0.01)
+        active.remove(task)
+        task.result = {"status": "completed", "files_created": []}
+        return task
+
+    for agent in orchestrator.agents.values():
+        monkeypatch.setattr(agent, "run_task", slow_run_task)
+
+    asyncio.run(orchestrator.execute_feature_development("Build an API"))
+
+    assert max(peak) == 1
+
+
+@pytest.mark.parametrize("value", [0, -1])
+def test_invalid_max_concurrent_agents_is_rejected(tmp_path, value):
+    with pytest.raises(ValueError, match="max_concurrent_agents must be at least 1"):
+        LangGraphOrchestrator(
+            workspace=str(tmp_path),
+            config={"max_concurrent_agents": value},
+            enable_chat_display=False
+        )
+
+
+def test_bug_fix_steps_pass_results_along(orchestrator, monkeypatch):
+    contexts = []
+
+    async def fake_run_task(task):
+        contexts.append(task.context)
+        task.result = {"step": task.context["task_type"], "files_created": [f"{task.context['task_type']}.md"]}
+        return task
+
+    for agent in orchestrator.agents.values():
+        monkeypatch.setattr(agent, "run_task", fake_run_task)
+
+    final_state = asyncio.run(orchestrator.execute_bug_fix("Fix login", "Login fails"))
+
+    assert [c["task_type"] for c in contexts] == [
+        "bug_analysis", "bug_fix", "regression_testing", "release_notes"
+    ]
+    assert contexts[0]["bug_description"] == "Login fails"
+    assert contexts[1]["bug_analysis"]["step"] == "bug_analysis"
+    assert contexts[3]["bug_fix"]["step"] == "bug_fix"
+    assert final_state["release_notes"]["status"] == "completed"
+
+
+def test_bug_fix_saves_merged_state(orchestrator, tmp_path, monkeypatch):
+    async def fake_run_task(task):
+        task.result = {"files_created": [f"{task.context['task_type']}.md"]}
+        return task
+
+    for agent in orchestrator.agents.values():
+        monkeypatch.setattr(agent, "run_task", fake_run_task)
+
+    asyncio.run(orchestrator.execute_bug_fix("Fix login", "Login fails"))
+
+    saved_file, = (tmp_path / "output").glob("langgraph_*.json")
+    saved = json.loads(saved_file.read_text())
+    assert saved["status"] == "completed"
+    assert saved["requirement"] == "Fix login"
+    assert saved["completed_steps"] == [
+        "bug_analysis", "bug_fix", "regression_testing", "release_notes"
+    ]
+    assert saved["files_created"] == [
+        "bug_analysis.md", "bug_fix.md", "regression_testing.md", "release_notes.md"
+    ]
+
+
+def test_merge_event_uses_the_given_schema_reducers():
+    reducers = langgraph_orchestrator._STATE_REDUCERS[langgraph_orchestrator.BugFixState]
+    state = {"files_created": ["a.py"], "completed_steps": ["bug_analysis"], "current_step": "bug_analysis"}
+
+    langgraph_orchestrator._merge_event(
+        state,
+        {"bug_fix": {"files_created": ["a.py", "b.py"], "completed_steps": ["bug_fix"], "current_step": "bug_fix"}},
+        reducers,
+    )
+
+    assert state == {
+        "files_created": ["a.py", "b.py"],
+        "completed_steps": ["bug_analysis", "bug_fix"],
+        "current_step": "bug_fix",
+    }
@@ -0,0 +1,16 @@
+"""Tests for LangGraph state helpers"""
+from src.orchestrator.langgraph_state import add_unique
+
+
+def test_add_unique_skips_known_items_and_keeps_order():
+    assert add_unique(["a.py", "b.py"], ["b.py", "c.py", "a.py", "c.py"]) == ["a.py", "b.py", "c.py"]
+
+
+def test_add_unique_does_not_mutate_inputs():
+    left = ["a.py"]
+
+    merged = add_unique(left, ["b.py"])
+
+    assert left == ["a.py"]
+    assert merged == ["a.py", "b.py"]
+
@@ -0,0 +1,158 @@
+"""Tests for configuration loading and caching"""
+import asyncio
+import dataclasses
+import os
+
+import pytest
+
+from src.config.settings import ConfigValidationError, Settings, load_config, load_config_async
+
+
+@pytest.fixture
+def config_file(tmp_path, monkeypatch):
+    """Write a minimal YAML config and clear workspace overrides"""
+    monkeypatch.delenv('WORKSPACE', raising=False)
+    monkeypatch.delenv('CURSOR_WORKSPACE', raising=False)
+
+    path = tmp_path / "config.yaml"
+    path.write_text('workspace: "."\nlog_level: "INFO"\n')
+    return path
+
+
+def test_load_config_resolves_workspace(config_file):
+    settings = load_config(str(config_file))
+
+    assert settings.workspace == str(config_file.parent.resolve())
+    assert settings.log_level == "INFO"
+
+
+def test_load_config_reuses_settings_for_unchanged_file(config_file):
+    first = load_config(str(config_file))
+    second = load_config(str(config_file))
+
+    assert first is second
+
+
+def test_load_config_reloads_after_file_change(config_file):
+    first = load_config(str(config_file))
+
+    config_file.write_text('workspace: "."\nlog_level: "DEBUG"\n')
+    stat = config_file.stat()
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    second = load_config(str(config_file))
+
+    assert second is not first
+    assert second.log_level == "DEBUG"
+
+
+def test_load_config_honours_workspace_env(config_file, tmp_path, monkeypatch):
+    first = load_config(str(config_file))
+
+    override = tmp_path / "elsewhere"
+    override.mkdir()
+    monkeypatch.setenv('WORKSPACE', str(override))
+
+    second = load_config(str(config_file))
+
+    assert second is not first
+    assert second.workspace == str(override.resolve())
+
+
+def test_load_config_missing_file_uses_cwd(tmp_path):
+    settings = load_config(str(tmp_path / "missing.yaml"))
+
+    assert settings.workspace == os.getcwd()
+
+
+def test_load_config_json_side_cache(config_file, monkeypatch):
+    monkeypatch.setenv('AGENT_CONFIG_CACHE', '1')
+    cache_file = config_file.with_name("config.yaml.cache.json")
+
+    first = load_config(str(config_file))
+    assert cache_file.exists()
+
+    # A cache whose digest no longer matches the YAML must be ignored
+    config_file.write_text('workspace: "."\nlog_level: "ERROR"\n')
+    stat = cache_file.stat()
+    os.utime(cache_file, ns=(stat.st_atime_ns, config_file.stat().st_mtime_ns + 1_000_000))
+
+    second = load_config(str(config_file))
+
+    assert first.log_level == "INFO"
+    assert second.log_level == "ERROR"
+
+
+def test_settings_dict_round_trip():
+    settings = Settings.from_dict({
+        'cursor_workspace': '/tmp',
+        'cursor_timeout': 42,
+        'agents': {'developer': {'enabled': True}},
+        'unknown_key': 'ignored',
+    })
+
+    assert settings.workspace == '/tmp'
+    assert settings.llm_timeout == 42
+    assert settings.to_dict()['agents'] == {'developer': {'enabled': True}}
+    assert Settings.from_dict(settings.to_dict()) == settings
+
+
+def test_settings_validation_collects_all_errors(tmp_path):
+    with pytest.raises(ConfigValidationError) as exc_info:
+        Settings(
+            workspace=str(tmp_path),
+            log_level="VERBOSE",
+            llm_timeout=0,
+            llm_retry_initial_delay=5.0,
+            llm_retry_max_delay=1.0,
+        )
+
+    message = str(exc_info.value)
+    assert "log_level must be one of" in message
+    assert "llm_timeout must be positive, got 0" in message
+    assert "llm_retry_max_delay (1.0) must be greater" in message
+
+
+def test_settings_is_immutable(tmp_path):
+    settings = Settings(workspace=str(tmp_path))
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        settings.log_level = "DEBUG"
+
+    updated = dataclasses.replace(settings, log_level="DEBUG")
+    assert updated.log_level == "DEBUG"
+    assert settings.log_level == "INFO"
+
+
+def test_load_config_force_reload(config_file):
+    first = load_config(str(config_file))
+    second = load_config(str(config_file), force_reload=True)
+
+    assert second is not first
+    assert second == first
+
+
+def test_load_config_force_reload_rereads_dotenv(config_file, monkeypatch):
+    import dotenv
+
+    env_file = config_file.with_name(".env")
+    real_load_dotenv = dotenv.load_dotenv
+    monkeypatch.setattr(dotenv, 'load_dotenv', lambda **kwargs: real_load_dotenv(env_file, **kwargs))
+    monkeypatch.setenv('SETTINGS_TEST_VALUE', 'unset')
+
+    env_file.write_text("SETTINGS_TEST_VALUE=first\n")
+    load_config(str(config_file), force_reload=True)
+    assert os.environ['SETTINGS_TEST_VALUE'] == 'first'
+
+    env_file.write_text("SETTINGS_TEST_VALUE=second\n")
+    load_config(str(config_file))
+    assert os.environ['SETTINGS_TEST_VALUE'] == 'first'
+
+    load_config(str(config_file), force_reload=True)
+    assert os.environ['SETTINGS_TEST_VALUE'] == 'second'
+
+
+def test_load_config_async_shares_cache(config_file):
+    settings = asyncio.run(load_config_async(str(config_file)))
+
+    assert settings is load_config(str(config_file))
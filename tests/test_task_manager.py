@@ -0,0 +1,175 @@
+"""Tests for TaskManager dependency-aware execution"""
+import asyncio
+
+import pytest
+
+from src.agents.base_agent import Task
+from src.orchestrator.task_manager import TaskManager
+
+
+def make_manager(*specs):
+    """Build a TaskManager from (task_id, dependencies) pairs"""
+    manager = TaskManager()
+    for task_id, dependencies in specs:
+        manager.add_task(Task(
+            task_id=task_id,
+            description=task_id,
+            context={},
+            dependencies=list(dependencies),
+        ))
+    return manager
+
+
+def test_execute_tasks_respects_dependencies():
+    manager = make_manager(
+        ("docs", ["tests", "infra"]),
+        ("tests", ["impl"]),
+        ("infra", ["impl"]),
+        ("impl", []),
+    )
+    order = []
+
+    async def executor(task):
+        order.append(task.task_id)
+        await asyncio.sleep(0)
+        return task
+
+    results = asyncio.run(manager.execute_tasks(executor))
+
+    assert set(results) == {"impl", "tests", "infra", "docs"}
+    assert order[0] == "impl"
+    assert order[-1] == "docs"
+    assert manager.completed_tasks == set(results)
+
+
+def test_execute_tasks_runs_independent_tasks_concurrently():
+    manager = make_manager(("impl", []), ("tests", ["impl"]), ("infra", ["impl"]))
+    running = set()
+    overlapped = []
+
+    async def executor(task):
+        running.add(task.task_id)
+        await asyncio.sleep(0.01)
+        overlapped.append(set(running))
+        running.discard(task.task_id)
+        return task
+
+    asyncio.run(manager.execute_tasks(executor))
+
+    assert {"tests", "infra"} in overlapped
+
+
+def test_execute_tasks_skips_dependents_of_failed_tasks():
+    manager = make_manager(("impl", []), ("tests", ["impl"]))
+    executed = []
+
+    async def executor(task):
+        executed.append(task.task_id)
+        task.error = "boom"
+        return task
+
+    results = asyncio.run(manager.execute_tasks(executor))
+
+    assert executed == ["impl"]
+    assert "impl" in results["tests"].error
+    assert manager.failed_tasks == {"impl", "tests"}
+
+
+def test_execute_tasks_validates_graph_before_running():
+    manager = make_manager(("impl", []), ("tests", ["missing"]))
+    executed = []
+
+    async def executor(task):
+        executed.append(task.task_id)
+        return task
+
+    with pytest.raises(ValueError):
+        asyncio.run(manager.execute_tasks(executor))
+
+    assert executed == []
+
+
+def test_validate_task_graph_reports_all_problems():
+    manager = make_manager(("a", ["b"]), ("b", ["a"]), ("c", ["missing"]))
+
+    with pytest.raises(ValueError) as exc_info:
+        manager.validate_task_graph()
+
+    message = str(exc_info.value)
+    assert "task c depends on unknown task missing" in message
+    assert "dependency cycle" in message
+
+
+def test_execute_tasks_starts_tasks_as_soon_as_dependencies_finish():
+    manager = make_manager(
+        ("impl", []),
+        ("fast", ["impl"]),
+        ("slow", ["impl"]),
+        ("docs", ["fast"]),
+    )
+    events = []
+
+    async def executor(task):
+        events.append(f"start:{task.task_id}")
+        await asyncio.sleep(0.05 if task.task_id == "slow" else 0)
+        events.append(f"end:{task.task_id}")
+        return task
+
+    asyncio.run(manager.execute_tasks(executor))
+
+    assert events.index("start:docs") < events.index("end:slow")
+
+
+def test_get_next_task_returns_highest_priority_then_none():
+    manager = TaskManager()
+    low = Task(task_id="low", description="low", context={}, priority=1)
+    high = Task(task_id="high", description="high", context={}, priority=5)
+
+    async def drain():
+        await manager.enqueue_task(low)
+        await manager.enqueue_task(high)
+        return [await manager.get_next_task() for _ in range(3)]
+
+    assert asyncio.run(drain()) == [high, low, None]
+
+
+def test_mark_completed_enqueues_only_ready_dependents():
+    manager = make_manager(
+        ("impl", []),
+        ("tests", ["impl"]),
+        ("docs", ["impl", "tests"]),
+        ("other", []),
+    )
+
+    async def complete_impl():
+        manager.mark_completed("impl")
+        await asyncio.sleep(0)
+        return [await manager.get_next_task() for _ in range(2)]
+
+    first, second = asyncio.run(complete_impl())
+
+    assert first.task_id == "tests"
+    assert second is None
+
+
+def test_task_status_tracks_transitions():
+    manager = make_manager(("impl", []), ("tests", ["impl"]), ("docs", []))
+
+    async def executor(task):
+        if task.task_id == "tests":
+            task.error = "boom"
+        return task
+
+    asyncio.run(manager.execute_tasks(executor))
+
+    statuses = manager.get_all_tasks_status()["tasks"]
+    assert {task_id: status["status"] for task_id, status in statuses.items()} == {
+        "impl": "completed",
+        "tests": "failed",
+        "docs": "completed",
+    }
+    assert {node["id"]: node["status"] for node in manager.create_task_graph()["nodes"]} == {
+        "impl": "completed",
+        "tests": "failed",
+        "docs": "completed",
+    }